@@ -25,6 +25,7 @@ class OpenTelemetryConfig:
 
     service_name: str = "strands-location-service-weather"
     development_mode: bool = False
+    trace_sample_rate: float = 1.0
 
 
 @dataclass
@@ -44,6 +45,8 @@ class WeatherAPIConfig:
     user_agent_alerts: str = "LocationWeatherAlertsService/1.0"
     accept_header: str = "application/geo+json"
     timeout: int = 10
+    connect_timeout: float = 3.0
+    pool_maxsize: int = 20
 
 
 @dataclass
@@ -73,6 +76,8 @@ class GuardrailConfig:
     enable_content_filtering: bool = True
     enable_pii_detection: bool = True
     enable_toxicity_detection: bool = True
+    # Let plain queries with no injection trigger words skip validation
+    enable_pre_filter: bool = False
     # Location service specific: Allow ADDRESS PII for location queries
     blocked_pii_types: list[str] = None
     allowed_pii_types: list[str] = None
@@ -299,6 +304,12 @@ class AppConfig:
                 ),
             ),
             development_mode=os.getenv("DEVELOPMENT", "false").lower() == "true",
+            trace_sample_rate=float(
+                os.getenv(
+                    "OTEL_TRACE_SAMPLE_RATE",
+                    config_data.get("opentelemetry", {}).get("trace_sample_rate", 1.0),
+                )
+            ),
         )
 
         bedrock_config = BedrockConfig(
@@ -339,6 +350,18 @@ class AppConfig:
                     config_data.get("weather_api", {}).get("timeout", 30),
                 )
             ),
+            connect_timeout=float(
+                os.getenv(
+                    "WEATHER_API_CONNECT_TIMEOUT",
+                    config_data.get("weather_api", {}).get("connect_timeout", 3.0),
+                )
+            ),
+            pool_maxsize=int(
+                os.getenv(
+                    "WEATHER_API_POOL_MAXSIZE",
+                    config_data.get("weather_api", {}).get("pool_maxsize", 20),
+                )
+            ),
         )
 
         mcp_config = MCPConfig(
@@ -427,6 +450,11 @@ class AppConfig:
                 ),
             ).lower()
             == "true",
+            enable_pre_filter=os.getenv(
+                "GUARDRAIL_PRE_FILTER",
+                str(config_data.get("guardrail", {}).get("enable_pre_filter", False)),
+            ).lower()
+            == "true",
             content_filter_strength=os.getenv(
                 "GUARDRAIL_CONTENT_FILTER_STRENGTH",
                 config_data.get("guardrail", {}).get("content_filter_strength", "HIGH"),
@@ -18,18 +18,221 @@ References:
 - https://docs.aws.amazon.com/bedrock/latest/userguide/agents.html
 """
 
+import functools
+import hashlib
 import logging
 import re
+import threading
 from dataclasses import dataclass
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, ClassVar, Literal, overload
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from .caching import TTLCache
 from .config import GuardrailConfig
 
+try:
+    import hyperscan  # Optional: SIMD literal matching on x86_64
+
+    _HAS_HYPERSCAN = True
+except ImportError:
+    _HAS_HYPERSCAN = False
+
 logger = logging.getLogger(__name__)
 
+# Keywords indicating a legitimate location/weather query
+_LOCATION_KEYWORDS = frozenset(
+    {
+        "weather",
+        "temperature",
+        "forecast",
+        "rain",
+        "snow",
+        "storm",
+        "location",
+        "address",
+        "place",
+        "city",
+        "state",
+        "country",
+        "route",
+        "directions",
+        "nearby",
+        "find",
+        "search",
+    }
+)
+
+# High-risk injection phrases that are never allowed, even with location context
+_HIGH_RISK_PATTERNS = frozenset(
+    {
+        "ignore",
+        "forget",
+        "disregard",
+        "act as",
+        "you are now",
+        "pretend",
+        "roleplay",
+        "execute",
+        "system",
+        "override",
+        "jailbreak",
+        "developer mode",
+        "dan mode",
+    }
+)
+
+
+class _KeywordMatcher:
+    """Report whether any of a set of literal keywords occurs in text.
+
+    Uses a Hyperscan database when the optional ``hyperscan`` package is
+    installed, and a single regex alternation otherwise.
+    """
+
+    def __init__(self, keywords: frozenset[str]):
+        """Compile the keywords.
+
+        Args:
+            keywords: Lowercase literal keywords to match as substrings
+        """
+        ordered = sorted(keywords, key=lambda keyword: (-len(keyword), keyword))
+        self._pattern = re.compile("|".join(re.escape(k) for k in ordered))
+        self._database: Any = None
+        self._local = threading.local()
+
+        if _HAS_HYPERSCAN:
+            self._database = hyperscan.Database()
+            self._database.compile(
+                expressions=[keyword.encode("utf-8") for keyword in ordered],
+                ids=list(range(len(ordered))),
+                elements=len(ordered),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(ordered),
+                literal=True,
+            )
+
+    def search(self, text: str) -> bool:
+        """Check whether any keyword occurs in text.
+
+        Args:
+            text: Lowercase text to scan
+
+        Returns:
+            True if at least one keyword is a substring of text
+        """
+        if self._database is None:
+            return self._pattern.search(text) is not None
+
+        # Scratch space cannot be shared between concurrent scans
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._database)
+            self._local.scratch = scratch
+
+        try:
+            self._database.scan(
+                text.encode("utf-8"),
+                match_event_handler=_stop_on_first_match,
+                scratch=scratch,
+            )
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+
+def _stop_on_first_match(
+    match_id: int, start: int, end: int, flags: int, context: Any
+) -> bool:
+    """Halt a Hyperscan scan at its first match."""
+    return True
+
+
+# Literal fragments, one of which occurs in any text an injection pattern can
+# match once whitespace runs are collapsed to single spaces
+_INJECTION_TRIGGERS = frozenset(
+    {
+        "ignore",
+        "forget",
+        "disregard",
+        "prompt",
+        "instruction",
+        "rule",
+        "act as",
+        "you are",
+        "pretend",
+        "roleplay",
+        "override",
+        "instead of",
+        "execute",
+        "system",
+        "internal",
+        "hidden",
+        "secret",
+        "jailbreak",
+        "dan mode",
+        "developer mode",
+        "```",
+        "<script",
+        "print",
+        "run this",
+        "run the following",
+    }
+)
+
+_LOCATION_KEYWORD_MATCHER = _KeywordMatcher(_LOCATION_KEYWORDS)
+_HIGH_RISK_MATCHER = _KeywordMatcher(_HIGH_RISK_PATTERNS)
+_INJECTION_TRIGGER_MATCHER = _KeywordMatcher(_INJECTION_TRIGGERS)
+
+# PII entity types that are expected in location queries
+_ADDRESS_PII = frozenset({"ADDRESS", "US_STATE", "CITY", "ZIP_CODE", "COUNTRY"})
+
+# Guardrail verdicts for identical content are reused for a short period
+GUARDRAIL_CACHE_MAXSIZE = 1024
+GUARDRAIL_CACHE_TTL = 300
+
+# CloudWatch metrics are hourly sums over the last day; polling faster is wasted
+GUARDRAIL_METRICS_TTL = 300
+_METRICS_CACHE = TTLCache(maxsize=64, ttl=GUARDRAIL_METRICS_TTL)
+
+# Client settings shared by all Bedrock/CloudWatch clients in this module
+_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_client(service_name: str, region_name: str):
+    """Get a shared boto3 client for a service and region.
+
+    Clients are created once from the default session so credential
+    resolution, endpoint discovery and the connection pool are reused.
+
+    Args:
+        service_name: AWS service name (e.g. "bedrock-runtime")
+        region_name: AWS region name
+
+    Returns:
+        Cached boto3 client
+    """
+    return boto3.client(service_name, region_name=region_name, config=_CLIENT_CONFIG)
+
+
+def _content_cache_key(content: str) -> bytes:
+    """Hash content into a fixed-size cache key.
+
+    Args:
+        content: Text content sent to the guardrail
+
+    Returns:
+        16-byte blake2b digest of the UTF-8 encoded content
+    """
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
 
 @dataclass
 class GuardrailValidationResult:
@@ -53,7 +256,10 @@ class GuardrailValidator:
             region_name: AWS region name
         """
         self.config = config
-        self.bedrock_runtime = boto3.client("bedrock-runtime", region_name=region_name)
+        self.bedrock_runtime = _get_client("bedrock-runtime", region_name)
+        self._result_cache = TTLCache(
+            maxsize=GUARDRAIL_CACHE_MAXSIZE, ttl=GUARDRAIL_CACHE_TTL
+        )
 
     def validate_content(self, content: str) -> GuardrailValidationResult:
         """Validate content against configured guardrails.
@@ -73,6 +279,11 @@ class GuardrailValidator:
                 toxicity_detected=False,
             )
 
+        cache_key = _content_cache_key(content)
+        cached_result = self._result_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         try:
             response = self.bedrock_runtime.apply_guardrail(
                 guardrailIdentifier=self.config.guardrail_id,
@@ -85,42 +296,36 @@ class GuardrailValidator:
             action = response.get("action", "NONE")
             is_valid = action != "GUARDRAIL_INTERVENED"
 
-            blocked_content = []
-            pii_detected = []
-            toxicity_detected = False
-
-            # Extract details from outputs if available
-            outputs = response.get("outputs", [])
-            for output in outputs:
-                if "text" in output:
-                    # Check for content filtering
-                    if "contentPolicy" in response:
-                        for filter_result in response["contentPolicy"].get(
-                            "filters", []
-                        ):
-                            if filter_result.get("action") == "BLOCKED":
-                                blocked_content.append(
-                                    filter_result.get("type", "UNKNOWN")
-                                )
-
-                    # Check for PII detection
-                    if "sensitiveInformationPolicy" in response:
-                        for pii_result in response["sensitiveInformationPolicy"].get(
-                            "piiEntities", []
-                        ):
-                            if pii_result.get("action") == "BLOCKED":
-                                pii_detected.append(pii_result.get("type", "UNKNOWN"))
-
-                    # Check for toxicity
-                    if "toxicity" in response:
-                        toxicity_detected = response["toxicity"].get("score", 0) > 0.5
+            # Policy assessments are response-level, so read them exactly once
+            # Check for content filtering
+            blocked_content = [
+                filter_result.get("type", "UNKNOWN")
+                for filter_result in response.get("contentPolicy", {}).get(
+                    "filters", ()
+                )
+                if filter_result.get("action") == "BLOCKED"
+            ]
 
-            return GuardrailValidationResult(
+            # Check for PII detection
+            pii_detected = [
+                pii_result.get("type", "UNKNOWN")
+                for pii_result in response.get("sensitiveInformationPolicy", {}).get(
+                    "piiEntities", ()
+                )
+                if pii_result.get("action") == "BLOCKED"
+            ]
+
+            # Check for toxicity
+            toxicity_detected = response.get("toxicity", {}).get("score", 0) > 0.5
+
+            result = GuardrailValidationResult(
                 is_valid=is_valid,
                 blocked_content=blocked_content,
                 pii_detected=pii_detected,
                 toxicity_detected=toxicity_detected,
             )
+            self._result_cache.set(cache_key, result)
+            return result
 
         except ClientError as e:
             error_msg = f"Guardrail validation failed: {e}"
@@ -133,7 +338,9 @@ class GuardrailValidator:
                 error_message=error_msg,
             )
 
-    def is_location_query_safe(self, query: str) -> bool:
+    def is_location_query_safe(
+        self, query: str, result: GuardrailValidationResult | None = None
+    ) -> bool:
         """Check if a location query is safe for processing.
 
         This method performs basic validation for location queries,
@@ -141,120 +348,197 @@ class GuardrailValidator:
 
         Args:
             query: User query to validate
+            result: Precomputed validate_content result for the query; when
+                omitted the guardrail is applied here
 
         Returns:
             True if query is safe to process
         """
-        # First check with guardrails
-        result = self.validate_content(query)
-
-        # If guardrails blocked it, check if it's only due to address content
-        if not result.is_valid:
-            # If content was blocked for reasons other than PII, it's not safe
-            if result.blocked_content or result.toxicity_detected:
-                logger.warning(
-                    f"Query blocked due to content policy or toxicity: {query}"
-                )
-                return False
+        # First check with guardrails (unless the caller already did)
+        if result is None:
+            result = self.validate_content(query)
 
-            # If only PII was detected, check if it's address-related
-            if result.pii_detected:
-                address_related_pii = {
-                    "ADDRESS",
-                    "US_STATE",
-                    "CITY",
-                    "ZIP_CODE",
-                    "COUNTRY",
-                }
-                detected_pii = set(result.pii_detected)
-
-                # If all detected PII is address-related, consider it safe
-                if detected_pii.issubset(address_related_pii):
-                    logger.info(
-                        f"Allowing location query with address PII: {detected_pii}"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"Query blocked due to non-address PII: {detected_pii}"
-                    )
-                    return False
+        if result.is_valid:
+            return True
 
-            # If blocked for unknown reasons, err on the side of caution
-            logger.warning(f"Query blocked for unknown reasons: {query}")
+        # Guardrails blocked it; cheapest rejection signals first
+        if result.blocked_content or result.toxicity_detected:
+            logger.warning("Query blocked due to content policy or toxicity: %s", query)
             return False
 
-        return result.is_valid
+        # If blocked for unknown reasons, err on the side of caution
+        if not result.pii_detected:
+            logger.warning("Query blocked for unknown reasons: %s", query)
+            return False
+
+        # If all detected PII is address-related, consider it safe
+        if _ADDRESS_PII.issuperset(result.pii_detected):
+            logger.info(
+                "Allowing location query with address PII: %s", result.pii_detected
+            )
+            return True
+
+        logger.warning("Query blocked due to non-address PII: %s", result.pii_detected)
+        return False
+
+
+def _findall_value(match: re.Match[str]) -> str | tuple[str, ...]:
+    """Return a match in the same shape re.findall would produce it."""
+    groups = match.groups(default="")
+    if not groups:
+        return match.group()
+    return groups[0] if len(groups) == 1 else groups
+
+
+def _is_excluded(text: str, match: re.Match[str], words: tuple[str, ...]) -> bool:
+    """Check whether an exclusion word follows the match on the same line.
+
+    Words are counted from the "subject" group when the pattern has one, or
+    else from the end of the match.
+    """
+    if "subject" in match.re.groupindex:
+        start = match.start("subject")
+    else:
+        start = match.end()
+    end = text.find("\n", start)
+    line = text[start:] if end == -1 else text[start:end]
+    return any(word in line for word in words)
+
+
+def _first_match(
+    pattern: re.Pattern[str], exclusions: tuple[str, ...], text: str
+) -> re.Match[str] | None:
+    """Return the first match of a pattern that is not excluded."""
+    if not exclusions:
+        return pattern.search(text)
+    for match in pattern.finditer(text):
+        if not _is_excluded(text, match, exclusions):
+            return match
+    return None
 
 
 class PromptInjectionDetector:
     """Detects potential prompt injection attempts."""
 
-    # Common prompt injection patterns
-    INJECTION_PATTERNS = [
+    # Common prompt injection patterns, matched against casefolded text
+    INJECTION_PATTERNS: ClassVar[list[str]] = [
         # Direct instruction attempts
-        r"(?i)(ignore|forget|disregard).*(previous|above|earlier).*(instruction|prompt|rule)",
-        r"(?i)(ignore|forget|disregard).*(instruction|prompt|rule)",
-        r"(?i)(system|assistant|ai).*(prompt|instruction|rule)",
-        r"(?i)act\s+as\s+(if\s+you\s+are\s+)?(?!.*weather|.*location)",
+        r"(ignore|forget|disregard).*(previous|above|earlier).*(instruction|prompt|rule)",
+        r"(ignore|forget|disregard).*(instruction|prompt|rule)",
+        r"(system|assistant|ai).*(prompt|instruction|rule)",
+        r"act\s+as\s+(if\s+you\s+are\s+)?",
         # Role manipulation - more specific patterns
-        r"(?i)you\s+are\s+(now\s+)?(a\s+|an\s+)?(?!.*weather|.*location|.*assistant|.*service|.*helpful)(pirate|hacker|criminal|different|evil)",
-        r"(?i)you\s+are\s+now\s+a\s+",
-        r"(?i)pretend\s+(to\s+be|you\s+are)",
-        r"(?i)roleplay\s+as",
+        r"you\s+are\s+(now\s+)?(a\s+|an\s+)?(?P<subject>pirate|hacker|criminal|different|evil)",
+        r"you\s+are\s+now\s+a\s+",
+        r"pretend\s+(to\s+be|you\s+are)",
+        r"roleplay\s+as",
         # Instruction injection
-        r"(?i)new\s+(instruction|rule|prompt)",
-        r"(?i)override\s+(previous|system|default)",
-        r"(?i)instead\s+of.*do",
+        r"new\s+(instruction|rule|prompt)",
+        r"override\s+(previous|system|default)",
+        r"instead\s+of.*do",
         # Code injection attempts
         r"```\s*(?:python|javascript|sql|bash|sh|cmd)",
         r"<script[^>]*>",
-        r"(?i)execute\s+(this\s+)?(code|command|script)",
-        r"(?i)execute\s+this\s*:",
-        r"(?i)print\s*\(\s*['\"].*['\"]",
-        r"(?i)(run|execute)\s+(this|the\s+following)\s*:",
+        r"execute\s+(this\s+)?(code|command|script)",
+        r"execute\s+this\s*:",
+        r"print\s*\(\s*['\"].*['\"]",
+        r"(run|execute)\s+(this|the\s+following)\s*:",
         # Data extraction attempts
-        r"(?i)(show|display|print|output).*(system|internal|hidden|secret)",
-        r"(?i)(reveal|expose|leak).*(prompt|instruction|rule)",
-        r"(?i)(tell|show)\s+me.*(secret|hidden|internal)",
+        r"(show|display|print|output).*(system|internal|hidden|secret)",
+        r"(reveal|expose|leak).*(prompt|instruction|rule)",
+        r"(tell|show)\s+me.*(secret|hidden|internal)",
         # Jailbreak attempts
-        r"(?i)jailbreak",
-        r"(?i)dan\s+mode",
-        r"(?i)developer\s+mode",
+        r"jailbreak",
+        r"dan\s+mode",
+        r"developer\s+mode",
         # Additional common patterns
-        r"(?i)ignore\s+(all\s+)?(previous\s+)?instructions",
-        r"(?i)forget\s+(everything|all)",
-        r"(?i)forget\s+(the\s+)?(weather|location)",
-        r"(?i)system\s*:\s*override",
+        r"ignore\s+(all\s+)?(previous\s+)?instructions",
+        r"forget\s+(everything|all)",
+        r"forget\s+(the\s+)?(weather|location)",
+        r"system\s*:\s*override",
     ]
 
+    # Words that suppress a pattern when they appear later on the same line.
+    # Checked after matching rather than with (?!.*word) lookaheads, which
+    # rescan the rest of the line at every candidate position.
+    PATTERN_EXCLUSIONS: ClassVar[dict[str, tuple[str, ...]]] = {
+        r"act\s+as\s+(if\s+you\s+are\s+)?": ("weather", "location"),
+        r"you\s+are\s+(now\s+)?(a\s+|an\s+)?(?P<subject>pirate|hacker|criminal|different|evil)": (
+            "weather",
+            "location",
+            "assistant",
+            "service",
+            "helpful",
+        ),
+    }
+
     def __init__(self):
         """Initialize the prompt injection detector."""
-        self.compiled_patterns = [
-            re.compile(pattern) for pattern in self.INJECTION_PATTERNS
-        ]
+        self.compiled_patterns = _COMPILED_PATTERNS
+        self.pattern_exclusions = _PATTERN_EXCLUSIONS
+
+    @overload
+    def detect_injection(
+        self, text: str, *, mode: Literal["full"] = "full"
+    ) -> dict[str, Any]: ...
 
-    def detect_injection(self, text: str) -> dict[str, Any]:
+    @overload
+    def detect_injection(self, text: str, *, mode: Literal["any"]) -> bool: ...
+
+    def detect_injection(
+        self, text: str, *, mode: str = "full"
+    ) -> dict[str, Any] | bool:
         """Detect potential prompt injection in text.
 
         Args:
             text: Text to analyze
+            mode: "full" to report every matching pattern, or "any" to stop at
+                the first match and return a bool
 
         Returns:
-            Dictionary with detection results
+            Dictionary with detection results, or whether any pattern matched
+            in "any" mode
         """
+        if mode not in ("full", "any"):
+            raise ValueError(f"Unsupported detection mode: {mode}")
+
+        text = text.casefold()
+
+        # Every pattern needs one of the trigger fragments, so text without
+        # any of them is clean after a single literal scan
+        triggered = _INJECTION_TRIGGER_MATCHER.search(" ".join(text.split()))
+
+        if mode == "any":
+            if not triggered:
+                return False
+            if _FUSED_PATTERN.search(text) is not None:
+                return True
+            return any(
+                _first_match(pattern, exclusions, text) is not None
+                for pattern, exclusions in _EXCLUDABLE_PATTERNS
+            )
+
         detected_patterns = []
 
-        for i, pattern in enumerate(self.compiled_patterns):
-            matches = pattern.findall(text)
-            if matches:
-                detected_patterns.append(
-                    {
-                        "pattern_index": i,
-                        "pattern": self.INJECTION_PATTERNS[i],
-                        "matches": matches,
-                    }
-                )
+        if triggered:
+            for i, pattern in enumerate(self.compiled_patterns):
+                exclusions = self.pattern_exclusions[i]
+                if exclusions:
+                    matches = [
+                        _findall_value(match)
+                        for match in pattern.finditer(text)
+                        if not _is_excluded(text, match, exclusions)
+                    ]
+                else:
+                    matches = pattern.findall(text)
+                if matches:
+                    detected_patterns.append(
+                        {
+                            "pattern_index": i,
+                            "pattern": self.INJECTION_PATTERNS[i],
+                            "matches": matches,
+                        }
+                    )
 
         is_injection = len(detected_patterns) > 0
 
@@ -268,79 +552,129 @@ class PromptInjectionDetector:
             "recommendation": "BLOCK" if is_injection else "ALLOW",
         }
 
-    def is_safe_location_query(self, query: str) -> bool:
+    def is_safe_location_query(
+        self,
+        query: str,
+        detection_result: dict[str, Any] | None = None,
+        query_lower: str | None = None,
+    ) -> bool:
         """Check if query is a safe location/weather query.
 
         Args:
             query: User query to check
+            detection_result: Precomputed detect_injection result for the query
+            query_lower: Precomputed lowercase form of the query
 
         Returns:
             True if query appears to be a legitimate location/weather query
         """
-        detection_result = self.detect_injection(query)
-
-        # If no injection detected, it's safe
-        if not detection_result["is_injection"]:
+        if detection_result is None:
+            # Cheap first pass; the full scan is only needed for the risk score
+            if not self.detect_injection(query, mode="any"):
+                return True
+        elif not detection_result["is_injection"]:
+            # If no injection detected, it's safe
             return True
 
         # If injection detected, be very strict about allowing it
         # Only allow very specific false positive cases with very low risk
-        location_keywords = [
-            "weather",
-            "temperature",
-            "forecast",
-            "rain",
-            "snow",
-            "storm",
-            "location",
-            "address",
-            "place",
-            "city",
-            "state",
-            "country",
-            "route",
-            "directions",
-            "nearby",
-            "find",
-            "search",
-        ]
-
-        query_lower = query.lower()
-        has_location_keywords = any(
-            keyword in query_lower for keyword in location_keywords
-        )
-
-        # Check for high-risk injection patterns that should never be allowed
-        high_risk_patterns = [
-            "ignore",
-            "forget",
-            "disregard",
-            "act as",
-            "you are now",
-            "pretend",
-            "roleplay",
-            "execute",
-            "system",
-            "override",
-            "jailbreak",
-            "developer mode",
-            "dan mode",
-        ]
-
-        has_high_risk = any(pattern in query_lower for pattern in high_risk_patterns)
+        if query_lower is None:
+            query_lower = query.lower()
 
         # If it has high-risk patterns, never allow it regardless of location keywords
-        if has_high_risk:
+        if _HIGH_RISK_MATCHER.search(query_lower):
+            return False
+
+        if not _LOCATION_KEYWORD_MATCHER.search(query_lower):
             return False
 
+        if detection_result is None:
+            detection_result = self.detect_injection(query)
+
         # Only allow if it has location keywords, very low risk score, and no high-risk patterns
-        if has_location_keywords and detection_result["risk_score"] < 0.1:
-            logger.warning(f"Potential false positive for location query: {query}")
+        if detection_result["risk_score"] < 0.1:
+            logger.warning("Potential false positive for location query: %s", query)
             return True
 
         return False
 
 
+# Patterns are compiled once per process and shared by every detector
+_COMPILED_PATTERNS = tuple(
+    re.compile(pattern) for pattern in PromptInjectionDetector.INJECTION_PATTERNS
+)
+_PATTERN_EXCLUSIONS = tuple(
+    PromptInjectionDetector.PATTERN_EXCLUSIONS.get(pattern, ())
+    for pattern in PromptInjectionDetector.INJECTION_PATTERNS
+)
+
+# Patterns without exclusions fused into one alternation for the "any" check;
+# the rest still need a per-match exclusion check
+_FUSED_PATTERN = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern, exclusions in zip(
+            PromptInjectionDetector.INJECTION_PATTERNS, _PATTERN_EXCLUSIONS, strict=True
+        )
+        if not exclusions
+    )
+)
+_EXCLUDABLE_PATTERNS = tuple(
+    (pattern, exclusions)
+    for pattern, exclusions in zip(_COMPILED_PATTERNS, _PATTERN_EXCLUSIONS, strict=True)
+    if exclusions
+)
+
+# Shared detector instance
+_DETECTOR = PromptInjectionDetector()
+
+
+# Short plain-text queries (no digits, so no numeric PII) may skip validation
+_PRE_FILTER_MAX_LENGTH = 160
+_CLEAN_QUERY_RE = re.compile(r"[a-z ,.?!'-]*")
+_LONG_TOKEN_RE = re.compile(r"[a-z]{24,}")
+
+
+def _is_trivially_clean(query_lower: str) -> bool:
+    """Check whether a query is plain text with no injection trigger words.
+
+    Args:
+        query_lower: Lowercase form of the query
+
+    Returns:
+        True if the query cannot match any prompt injection pattern and is
+        too simple to carry sensitive information
+    """
+    if len(query_lower) > _PRE_FILTER_MAX_LENGTH:
+        return False
+    if _CLEAN_QUERY_RE.fullmatch(query_lower) is None:
+        return False
+    # Long unbroken runs look like encoded payloads rather than words
+    if _LONG_TOKEN_RE.search(query_lower) is not None:
+        return False
+    return not _INJECTION_TRIGGER_MATCHER.search(" ".join(query_lower.split()))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(
+    guardrail_id: str, guardrail_version: str, region_name: str = "us-east-1"
+) -> GuardrailValidator:
+    """Get a shared validator (and Bedrock runtime client) for a guardrail.
+
+    Args:
+        guardrail_id: Guardrail identifier
+        guardrail_version: Guardrail version
+        region_name: AWS region name
+
+    Returns:
+        Cached GuardrailValidator for the guardrail
+    """
+    config = GuardrailConfig(
+        guardrail_id=guardrail_id, guardrail_version=guardrail_version
+    )
+    return GuardrailValidator(config, region_name=region_name)
+
+
 def create_guardrail_cdk_config(config: GuardrailConfig) -> dict[str, Any]:
     """Create CDK configuration for Bedrock Guardrail.
 
@@ -350,7 +684,7 @@ def create_guardrail_cdk_config(config: GuardrailConfig) -> dict[str, Any]:
     Returns:
         Dictionary suitable for CDK CfnGuardrail construct
     """
-    cdk_config = {
+    cdk_config: dict[str, Any] = {
         "name": "location-weather-guardrail",
         "description": "Guardrail for location weather service with address PII allowed",
     }
@@ -425,7 +759,7 @@ class GuardrailIntegration:
             if config.enable_toxicity_detection:
                 model_params["guardrail_toxicity_detection"] = True
 
-            logging.info(f"Applied model-level guardrails: {config.guardrail_id}")
+            logger.info("Applied model-level guardrails: %s", config.guardrail_id)
 
         return model_params
 
@@ -459,7 +793,7 @@ class GuardrailIntegration:
                 "toxicity_filter_strength": config.toxicity_filter_strength,
             }
 
-            logging.info(f"Applied agent-level guardrails: {config.guardrail_id}")
+            logger.info("Applied agent-level guardrails: %s", config.guardrail_id)
 
         return agent_params
 
@@ -480,24 +814,24 @@ class GuardrailIntegration:
             True if guardrail is accessible, False otherwise
         """
         try:
-            bedrock_client = boto3.client("bedrock", region_name=region_name)
+            bedrock_client = _get_client("bedrock", region_name)
 
             response = bedrock_client.get_guardrail(guardrailIdentifier=guardrail_id)
 
             status = response.get("status", "UNKNOWN")
             if status == "READY":
-                logging.info(f"Guardrail {guardrail_id} is ready for use")
+                logger.info("Guardrail %s is ready for use", guardrail_id)
                 return True
             else:
-                logging.warning(f"Guardrail {guardrail_id} status: {status}")
+                logger.warning("Guardrail %s status: %s", guardrail_id, status)
                 return False
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             if error_code == "ResourceNotFoundException":
-                logging.error(f"Guardrail {guardrail_id} not found")
+                logger.error("Guardrail %s not found", guardrail_id)
             else:
-                logging.error(f"Error validating guardrail {guardrail_id}: {e}")
+                logger.error("Error validating guardrail %s: %s", guardrail_id, e)
             return False
 
     @staticmethod
@@ -516,28 +850,36 @@ class GuardrailIntegration:
         Returns:
             Dictionary with guardrail metrics
         """
+        cache_key = (guardrail_id, region_name)
+        cached = _METRICS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            cloudwatch = boto3.client("cloudwatch", region_name=region_name)
+            cloudwatch = _get_client("cloudwatch", region_name)
 
-            # Get guardrail invocation metrics
+            # Get guardrail invocation metrics for the last 24 hours
+            end_time = datetime.now(timezone.utc)
             response = cloudwatch.get_metric_statistics(
                 Namespace="AWS/Bedrock",
                 MetricName="GuardrailInvocations",
                 Dimensions=[{"Name": "GuardrailId", "Value": guardrail_id}],
-                StartTime=boto3.Session().region_name,  # Last 24 hours
-                EndTime=boto3.Session().region_name,
+                StartTime=end_time - timedelta(hours=24),
+                EndTime=end_time,
                 Period=3600,  # 1 hour periods
                 Statistics=["Sum"],
             )
 
-            return {
+            metrics = {
                 "guardrail_id": guardrail_id,
                 "invocations": response.get("Datapoints", []),
                 "status": "active" if response.get("Datapoints") else "inactive",
             }
+            _METRICS_CACHE.set(cache_key, metrics)
+            return metrics
 
         except Exception as e:
-            logging.error(f"Error getting guardrail metrics: {e}")
+            logger.error("Error getting guardrail metrics: %s", e)
             return {"guardrail_id": guardrail_id, "error": str(e), "status": "error"}
 
 
@@ -649,16 +991,22 @@ def validate_location_query_safety(
     Returns:
         Dictionary with comprehensive validation results
     """
-    results = {
+    query_lower = query.lower()
+    results: dict[str, Any] = {
         "query": query,
         "is_safe": True,
         "validation_results": {},
         "recommendations": [],
     }
 
+    # Plain queries without trigger words skip the remote and regex checks
+    pre_filtered = config.enable_pre_filter and _is_trivially_clean(query_lower)
+    if pre_filtered:
+        results["pre_filter"] = "clean"
+
     # 1. Bedrock Guardrails validation
-    if config.guardrail_id:
-        validator = GuardrailValidator(config)
+    if config.guardrail_id and not pre_filtered:
+        validator = _get_validator(config.guardrail_id, config.guardrail_version)
         guardrail_result = validator.validate_content(query)
         results["validation_results"]["guardrails"] = {
             "is_valid": guardrail_result.is_valid,
@@ -668,7 +1016,7 @@ def validate_location_query_safety(
         }
 
         # Check if it's safe for location queries specifically
-        location_safe = validator.is_location_query_safe(query)
+        location_safe = validator.is_location_query_safe(query, guardrail_result)
         results["validation_results"]["location_safe"] = location_safe
 
         if not location_safe:
@@ -676,44 +1024,25 @@ def validate_location_query_safety(
             results["recommendations"].append("Query blocked by Bedrock Guardrails")
 
     # 2. Prompt injection detection
-    detector = PromptInjectionDetector()
-    injection_result = detector.detect_injection(query)
-    results["validation_results"]["prompt_injection"] = injection_result
-
-    if injection_result["is_injection"]:
-        injection_safe = detector.is_safe_location_query(query)
-        results["validation_results"]["injection_safe"] = injection_safe
-
-        if not injection_safe:
-            results["is_safe"] = False
-            results["recommendations"].append(
-                "Query contains prompt injection patterns"
+    if not pre_filtered:
+        detector = _DETECTOR
+        injection_result = detector.detect_injection(query)
+        results["validation_results"]["prompt_injection"] = injection_result
+
+        if injection_result["is_injection"]:
+            injection_safe = detector.is_safe_location_query(
+                query, injection_result, query_lower
             )
+            results["validation_results"]["injection_safe"] = injection_safe
 
-    # 3. Location context analysis
-    location_keywords = [
-        "weather",
-        "temperature",
-        "forecast",
-        "rain",
-        "snow",
-        "storm",
-        "location",
-        "address",
-        "place",
-        "city",
-        "state",
-        "country",
-        "route",
-        "directions",
-        "nearby",
-        "find",
-        "search",
-    ]
+            if not injection_safe:
+                results["is_safe"] = False
+                results["recommendations"].append(
+                    "Query contains prompt injection patterns"
+                )
 
-    has_location_context = any(
-        keyword in query.lower() for keyword in location_keywords
-    )
+    # 3. Location context analysis
+    has_location_context = _LOCATION_KEYWORD_MATCHER.search(query_lower)
     results["validation_results"]["has_location_context"] = has_location_context
 
     if not has_location_context:
@@ -3,37 +3,122 @@ Location and weather services with Bedrock integration.
 This module combines location services, weather data, and Bedrock LLM capabilities.
 """
 
+import contextlib
+import contextvars
+import json
 import logging
+import operator
 import os
+import threading
+import time
 import uuid
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 import boto3
 import requests
+from botocore.config import Config
 from mcp import StdioServerParameters, stdio_client
 from opentelemetry import trace
+from requests.adapters import HTTPAdapter
 from strands import Agent, tool
 from strands.tools.mcp import MCPClient
 from strands_tools.current_time import current_time
+from urllib3.util.retry import Retry
 
+from .caching import SingleFlight, TTLCache
 from .config import DeploymentMode, config
 
+try:
+    import orjson  # Optional: faster decoding of NWS responses
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
-# Create a persistent HTTP session for better performance
+# Create a persistent HTTP session for better performance; the pool is sized
+# so concurrent tool calls and the fan-out executor can all reuse connections,
+# and transient NWS failures are retried on the kept-alive connection. Read
+# timeouts are not retried and Retry-After is ignored, so retries only add
+# the short backoff rather than server-chosen delays or repeated timeouts.
+_HTTP_RETRY = Retry(
+    total=2,
+    read=0,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
 _http_session = requests.Session()
+_http_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=config.weather_api.pool_maxsize,
+        max_retries=_HTTP_RETRY,
+    ),
+)
+
+# Weather API settings are fixed after startup; bind them once for the hot path
+_POINTS_URL_PREFIX = f"{config.weather_api.base_url}/points/"
+_ALERTS_URL_PREFIX = f"{config.weather_api.base_url}/alerts/active/zone/"
+# (connect, read): a short connect timeout lets the retry adapter move on from
+# an unreachable host instead of stalling for the whole read budget
+_WEATHER_API_TIMEOUT = (
+    min(config.weather_api.connect_timeout, config.weather_api.timeout),
+    config.weather_api.timeout,
+)
+_WEATHER_HEADERS = MappingProxyType(
+    {
+        "User-Agent": config.weather_api.user_agent_weather,
+        "Accept": config.weather_api.accept_header,
+    }
+)
+_ALERTS_HEADERS = MappingProxyType(
+    {
+        "User-Agent": config.weather_api.user_agent_alerts,
+        "Accept": config.weather_api.accept_header,
+    }
+)
+
+# Worker threads for fanning out independent weather API requests
+_http_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="weather-api")
+
+# NWS grid/zone lookups change rarely; cache them for a day
+POINTS_CACHE_MAXSIZE = 1024
+POINTS_CACHE_TTL = 86400
+POINTS_CACHE_PRECISION = 4
+_POINTS_CACHE = TTLCache(maxsize=POINTS_CACHE_MAXSIZE, ttl=POINTS_CACHE_TTL)
+# Tools run concurrently, so e.g. get_weather and get_alerts for a new location
+# would both miss the cache; they share one in-flight /points request instead
+_POINTS_INFLIGHT = SingleFlight()
+
+# Forecast periods are refreshed roughly hourly; reuse parsed fields for a while
+FORECAST_CACHE_MAXSIZE = 1024
+FORECAST_CACHE_TTL = 600
+_FORECAST_CACHE = TTLCache(maxsize=FORECAST_CACHE_MAXSIZE, ttl=FORECAST_CACHE_TTL)
+
+# Active alerts change on the order of minutes; cache formatted results briefly
+ALERTS_CACHE_MAXSIZE = 256
+ALERTS_CACHE_TTL = 60
+_ALERTS_CACHE = TTLCache(maxsize=ALERTS_CACHE_MAXSIZE, ttl=ALERTS_CACHE_TTL)
 
 # Optimized system prompt - essential guidelines with clear response instructions
 system_prompt = """You are a location and weather assistant. Use available tools to find locations and provide weather information.
 
-For weather queries, always use get_weather tool first to get temperature, conditions, and wind, then use get_alerts tool to check for warnings.
+For weather queries, use get_weather_and_alerts for conditions and warnings together, or use get_weather tool first for temperature, conditions, and wind, then use get_alerts tool for warnings.
 
 For route queries, always check weather alerts at both the origin and destination locations for travel safety.
 
-Tools: Use Amazon Location Service MCP tools for locations/routes, get_weather for conditions, get_alerts for warnings.
+Tools: Use Amazon Location Service MCP tools for locations/routes, get_weather_and_alerts for both, get_weather for conditions, get_alerts for warnings.
 
 Guidelines: Only provide information for public places. Respect privacy and prevent API abuse.
 
@@ -42,15 +127,59 @@ Be concise and helpful."""
 # Get a tracer for this module
 tracer = trace.get_tracer(__name__)
 
+# When tracing is disabled, spans become a shared no-op context manager instead
+# of going through the OpenTelemetry API on every call
+_TRACING_ENABLED = config.deployment.enable_tracing
+_NULL_SPAN_CM = contextlib.nullcontext(trace.INVALID_SPAN)
+
+# Value types accepted as OpenTelemetry span attributes
+_OTEL_ATTR_TYPES = (str, bool, int, float)
+
+# Longest prompt prefix recorded on the agent_interaction span
+_PROMPT_ATTR_MAX_LENGTH = 512
+
+# Bedrock Agent runtime client settings; the client is reused across chats
+_BEDROCK_AGENT_CLIENT_CONFIG = Config(
+    retries={"mode": "standard", "max_attempts": 3},
+    tcp_keepalive=True,
+)
+
+
+def _span(name: str) -> contextlib.AbstractContextManager[trace.Span]:
+    """Start a span as the current span, or a no-op span if tracing is disabled.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Context manager yielding the span
+    """
+    if _TRACING_ENABLED:
+        return tracer.start_as_current_span(name)
+    return _NULL_SPAN_CM
+
+
 # Initialize MCP client and tools - moved to function to avoid module-level execution issues
 stdio_mcp_client = None
 mcp_tools = []
+_mcp_init_lock = threading.Lock()
 
 
 def _initialize_mcp_client():
-    """Initialize MCP client and tools."""
+    """Initialize MCP client and tools on first use.
+
+    Only LOCAL and MCP modes call this, so importing the module or running in
+    BEDROCK_AGENT mode never spawns the MCP server. The lock keeps concurrent
+    client constructions from starting the server twice.
+    """
     global stdio_mcp_client, mcp_tools
-    if stdio_mcp_client is None:
+    if stdio_mcp_client is not None:
+        return
+
+    with _mcp_init_lock:
+        if stdio_mcp_client is not None:
+            return
+
         logger.info("Initializing MCP client")
         stdio_mcp_client = MCPClient(
             lambda: stdio_client(
@@ -64,117 +193,342 @@ def _initialize_mcp_client():
 
         # Get all available tools from the MCP server
         mcp_tools = stdio_mcp_client.list_tools_sync()
-        logger.info(f"Loaded {len(mcp_tools)} tools from MCP server")
+        logger.info("Loaded %d tools from MCP server", len(mcp_tools))
 
 
-@tool
-def get_weather(latitude: float, longitude: float) -> dict[str, Any]:
-    """Get weather information for a location
+# Fields read from the current forecast period, fetched in a single call
+_FORECAST_FIELDS = operator.itemgetter(
+    "temperature",
+    "temperatureUnit",
+    "windSpeed",
+    "windDirection",
+    "shortForecast",
+    "detailedForecast",
+)
 
-    Get current weather information for the specified coordinates using the National Weather Service API.
+
+class _GridPoint(NamedTuple):
+    """Parsed NWS /points metadata for a coordinate pair."""
+
+    forecast_url: str | None
+    county_zone: str | None
+
+
+def _nws_get(
+    url: str, headers: Mapping[str, str], attrs: dict[str, Any], name: str
+) -> requests.Response:
+    """Send a GET to the NWS API and record it on the calling tool's span.
+
+    Args:
+        url: Request URL
+        headers: Request headers
+        attrs: Span attributes of the calling tool
+        name: Attribute prefix for this request ("grid", "forecast", "alerts")
+
+    Returns:
+        The response; status handling is left to the caller
+    """
+    logger.debug("Requesting %s data from: %s", name, url)
+    start = time.monotonic()
+    response = _http_session.get(url, headers=headers, timeout=_WEATHER_API_TIMEOUT)
+    attrs[f"{name}.url"] = url
+    attrs[f"{name}.status_code"] = response.status_code
+    attrs[f"{name}.duration_ms"] = (time.monotonic() - start) * 1000
+    return response
+
+
+def _record_failure(status_code: int, attrs: dict[str, Any], what: str) -> int:
+    """Log a failed NWS request and record it as the span error.
+
+    Args:
+        status_code: HTTP status of the failed request
+        attrs: Span attributes of the calling tool
+        what: What was being fetched, used in the message ("grid", "zone", ...)
+
+    Returns:
+        The status code, for the tool's error result
+    """
+    error_msg = f"Failed to get {what} data: {status_code}"
+    logger.error(error_msg)
+    attrs["error"] = error_msg
+    return status_code
+
+
+def _get_points(
+    latitude: float, longitude: float, headers: Mapping[str, str], attrs: dict[str, Any]
+) -> tuple[_GridPoint | None, int]:
+    """Look up NWS grid and zone metadata for a coordinate pair.
+
+    The grid/zone mapping for a location is effectively static, so successful
+    lookups are cached, keyed on coordinates rounded to 4 decimals (~10 m).
+    Concurrent misses for the same key wait on a single request.
 
     Args:
         latitude: The latitude coordinate
         longitude: The longitude coordinate
+        headers: Request headers
+        attrs: Span attributes of the calling tool; receives grid.* entries
 
     Returns:
-        A dictionary containing weather information
+        Tuple of the parsed grid point (None on failure) and the HTTP status code
     """
-    logger.info(f"Getting weather for coordinates: {latitude}, {longitude}")
+    key = (
+        round(latitude, POINTS_CACHE_PRECISION),
+        round(longitude, POINTS_CACHE_PRECISION),
+    )
 
-    # Create a span for the entire weather API call process
-    with tracer.start_as_current_span("get_weather_api") as span:
-        # Add attributes to the span for context
-        span.set_attribute("latitude", latitude)
-        span.set_attribute("longitude", longitude)
+    grid = _POINTS_CACHE.get(key)
+    attrs["grid.cache_hit"] = grid is not None
+    if grid is not None:
+        return grid, 200
 
-        # Set headers for the request
-        headers = {
-            "User-Agent": config.weather_api.user_agent_weather,
-            "Accept": config.weather_api.accept_header,
-        }
+    return _POINTS_INFLIGHT.do(key, _fetch_points, key, headers, attrs)
 
-        try:
-            # First, get the grid endpoint for the coordinates
-            with tracer.start_as_current_span("get_grid_points") as grid_span:
-                points_url = (
-                    f"{config.weather_api.base_url}/points/{latitude},{longitude}"
-                )
-                grid_span.set_attribute("url", points_url)
 
-                points_response = _http_session.get(
-                    points_url, headers=headers, timeout=config.weather_api.timeout
-                )
-                grid_span.set_attribute("status_code", points_response.status_code)
+def _fetch_points(
+    key: tuple[float, float], headers: Mapping[str, str], attrs: dict[str, Any]
+) -> tuple[_GridPoint | None, int]:
+    """Request /points for rounded coordinates and cache a successful result.
 
-                if points_response.status_code != 200:
-                    error_msg = (
-                        f"Failed to get grid data: {points_response.status_code}"
-                    )
-                    logger.error(error_msg)
-                    span.set_attribute("error", error_msg)
-                    return {
-                        "error": "Failed to get grid data",
-                        "status": points_response.status_code,
-                    }
+    Args:
+        key: Rounded (latitude, longitude) pair
+        headers: Request headers
+        attrs: Span attributes of the calling tool; receives grid.* entries
+
+    Returns:
+        Tuple of the parsed grid point (None on failure) and the HTTP status code
+    """
+    points_url = f"{_POINTS_URL_PREFIX}{key[0]},{key[1]}"
+    points_response = _nws_get(points_url, headers, attrs, "grid")
+    if points_response.status_code != 200:
+        return None, points_response.status_code
 
-            points_data = points_response.json()
-            forecast_url = points_data["properties"]["forecast"]
+    properties = _json_loads(points_response.content)["properties"]
+    county = properties.get("county")
+    grid = _GridPoint(
+        forecast_url=properties.get("forecast"),
+        county_zone=county.split("/")[-1] if county else None,
+    )
+    _POINTS_CACHE.set(key, grid)
+    return grid, 200
 
-            # Get the forecast data
-            with tracer.start_as_current_span("get_forecast") as forecast_span:
-                forecast_span.set_attribute("url", forecast_url)
 
-                forecast_response = _http_session.get(
-                    forecast_url, headers=headers, timeout=config.weather_api.timeout
-                )
-                forecast_span.set_attribute(
-                    "status_code", forecast_response.status_code
-                )
+def _get_forecast(
+    forecast_url: str, headers: Mapping[str, str], attrs: dict[str, Any]
+) -> dict[str, Any]:
+    """Fetch and format the current forecast period.
 
-                if forecast_response.status_code != 200:
-                    error_msg = (
-                        f"Failed to get forecast data: {forecast_response.status_code}"
-                    )
-                    logger.error(error_msg)
-                    span.set_attribute("error", error_msg)
-                    return {
-                        "error": "Failed to get forecast data",
-                        "status": forecast_response.status_code,
-                    }
+    The parsed period fields are cached per forecast URL for a few minutes,
+    well inside the interval at which NWS refreshes gridpoint forecasts.
+
+    Args:
+        forecast_url: Forecast URL from the /points response
+        headers: Request headers
+        attrs: Span attributes of the calling tool; receives forecast.* entries
+
+    Returns:
+        A dictionary containing weather information, or an error
+    """
+    fields = _FORECAST_CACHE.get(forecast_url)
+    attrs["forecast.cache_hit"] = fields is not None
+    if fields is None:
+        forecast_response = _nws_get(forecast_url, headers, attrs, "forecast")
+        if forecast_response.status_code != 200:
+            return {
+                "error": "Failed to get forecast data",
+                "status": _record_failure(
+                    forecast_response.status_code, attrs, "forecast"
+                ),
+            }
+
+        forecast_data = _json_loads(forecast_response.content)
+        fields = _FORECAST_FIELDS(forecast_data["properties"]["periods"][0])
+        _FORECAST_CACHE.set(forecast_url, fields)
+
+    (
+        temperature,
+        temperature_unit,
+        wind_speed,
+        wind_direction,
+        short_forecast,
+        detailed_forecast,
+    ) = fields
+
+    # Add success attributes to the span
+    attrs["temperature"] = temperature
+    attrs["forecast"] = short_forecast
+
+    logger.info(
+        "Weather retrieved: %s°%s, %s", temperature, temperature_unit, short_forecast
+    )
+
+    # Return formatted weather data
+    return {
+        "temperature": {"value": temperature, "unit": temperature_unit},
+        "windSpeed": {"value": wind_speed, "unit": "mph"},
+        "windDirection": wind_direction,
+        "shortForecast": short_forecast,
+        "detailedForecast": detailed_forecast,
+    }
+
+
+def _format_alert_time(value: str) -> str:
+    """Reformat an NWS ISO-8601 timestamp as "YYYY-MM-DD HH:MM:SS <tz>".
+
+    NWS timestamps are always "YYYY-MM-DDTHH:MM:SS" plus "Z" or a "+HH:MM"
+    offset, so the common case is handled by slicing; anything else goes
+    through datetime parsing. The output matches strftime("%Y-%m-%d %H:%M:%S %Z").
+
+    Args:
+        value: Timestamp string from an alert
+
+    Returns:
+        The reformatted timestamp, or the original string if it cannot be parsed
+    """
+    offset = value[19:]
+    if value[10:11] == "T" and (
+        offset == "Z" or (len(offset) == 6 and offset[0] in "+-" and offset[3] == ":")
+    ):
+        tz = "UTC" if offset in ("Z", "+00:00", "-00:00") else f"UTC{offset}"
+        return f"{value[:10]} {value[11:19]} {tz}"
+
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as date_error:
+        logger.warning("Error parsing date: %s", date_error)
+        # Keep original format if parsing fails
+        return value
+    return parsed.strftime("%Y-%m-%d %H:%M:%S %Z")
+
+
+def _build_alert(properties: dict[str, Any]) -> dict[str, Any]:
+    """Format the properties of one NWS alert feature.
+
+    Args:
+        properties: The feature's "properties" object
+
+    Returns:
+        Alert details with readable effective/expires times
+    """
+    get = properties.get
+
+    # Convert effective and expires times to more readable format
+    effective = get("effective")
+    expires = get("expires")
+
+    return {
+        "event": get("event"),
+        "headline": get("headline"),
+        "description": get("description"),
+        "severity": get("severity"),
+        "urgency": get("urgency"),
+        "effective": _format_alert_time(effective) if effective else effective,
+        "expires": _format_alert_time(expires) if expires else expires,
+        "instruction": get("instruction"),
+    }
+
+
+def _get_zone_alerts(
+    county_zone: str, headers: Mapping[str, str], attrs: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Fetch and format active alerts for a county/zone code.
+
+    Formatted results are cached per zone for a short time, since alerts
+    change on the order of minutes and routes often query the same zone twice.
+
+    Args:
+        county_zone: NWS county/zone code from the /points response
+        headers: Request headers
+        attrs: Span attributes of the calling tool; receives alerts.* entries
 
-            forecast_data = forecast_response.json()
-            current_period = forecast_data["properties"]["periods"][0]
-
-            # Return formatted weather data
-            result = {
-                "temperature": {
-                    "value": current_period["temperature"],
-                    "unit": current_period["temperatureUnit"],
-                },
-                "windSpeed": {"value": current_period["windSpeed"], "unit": "mph"},
-                "windDirection": current_period["windDirection"],
-                "shortForecast": current_period["shortForecast"],
-                "detailedForecast": current_period["detailedForecast"],
+    Returns:
+        A list of active weather alerts, a "no alerts" message, or an error
+    """
+    cached = _ALERTS_CACHE.get(county_zone)
+    attrs["alerts.cache_hit"] = cached is not None
+    if cached is not None:
+        attrs["alert_count"] = cached[0]
+        return [dict(alert) for alert in cached[1]]
+
+    alerts_url = f"{_ALERTS_URL_PREFIX}{county_zone}"
+    alerts_response = _nws_get(alerts_url, headers, attrs, "alerts")
+    if alerts_response.status_code != 200:
+        return [
+            {
+                "error": "Failed to get alerts data",
+                "status": _record_failure(alerts_response.status_code, attrs, "alerts"),
             }
+        ]
+
+    features = _json_loads(alerts_response.content).get("features") or ()
+
+    # Add count to span
+    alert_count = len(features)
+    attrs["alert_count"] = alert_count
+
+    # If no alerts, return a clear message
+    if not features:
+        logger.info("No active weather alerts found for this location")
+        alerts = [{"message": "No active weather alerts for this location"}]
+    else:
+        # Process and format the alerts
+        alerts = [_build_alert(feature.get("properties", {})) for feature in features]
+        logger.info("Found %d active weather alert(s)", alert_count)
+
+    _ALERTS_CACHE.set(county_zone, (alert_count, alerts))
+    return [dict(alert) for alert in alerts]
+
+
+@tool
+def get_weather(latitude: float, longitude: float) -> dict[str, Any]:
+    """Get weather information for a location
 
-            # Add success attributes to the span
-            span.set_attribute("temperature", current_period["temperature"])
-            span.set_attribute("forecast", current_period["shortForecast"])
+    Get current weather information for the specified coordinates using the National Weather Service API.
+
+    Args:
+        latitude: The latitude coordinate
+        longitude: The longitude coordinate
+
+    Returns:
+        A dictionary containing weather information
+    """
+    logger.info("Getting weather for coordinates: %s, %s", latitude, longitude)
+
+    # Create a span for the entire weather API call process
+    with _span("get_weather_api") as span:
+        # Collect span attributes and set them in one call when done
+        attrs: dict[str, Any] = {"latitude": latitude, "longitude": longitude}
 
-            logger.info(
-                f"Weather retrieved: {current_period['temperature']}°{current_period['temperatureUnit']}, {current_period['shortForecast']}"
+        try:
+            # First, get the grid endpoint for the coordinates
+            grid, status_code = _get_points(
+                latitude, longitude, _WEATHER_HEADERS, attrs
             )
-            return result
+
+            if grid is None:
+                return {
+                    "error": "Failed to get grid data",
+                    "status": _record_failure(status_code, attrs, "grid"),
+                }
+
+            if grid.forecast_url is None:
+                attrs["error"] = "No forecast for location"
+                return {"error": "No forecast available for this location"}
+
+            # Get the forecast data
+            return _get_forecast(grid.forecast_url, _WEATHER_HEADERS, attrs)
 
         except Exception as e:
             # Record the error in the span
             error_msg = f"Error fetching weather data: {str(e)}"
             logger.error(error_msg)
-            span.set_attribute("error", str(e))
+            attrs["error"] = str(e)
             span.record_exception(e)
             return {"error": error_msg}
 
+        finally:
+            span.set_attributes(attrs)
+
 
 @tool
 def get_alerts(latitude: float, longitude: float) -> list[dict[str, Any]]:
@@ -189,136 +543,147 @@ def get_alerts(latitude: float, longitude: float) -> list[dict[str, Any]]:
     Returns:
         A list of active weather alerts with their details
     """
-    logger.info(f"Getting weather alerts for coordinates: {latitude}, {longitude}")
+    logger.info("Getting weather alerts for coordinates: %s, %s", latitude, longitude)
 
     # Create a span for the alerts API call
-    with tracer.start_as_current_span("get_weather_alerts") as span:
-        # Add attributes to the span for context
-        span.set_attribute("latitude", latitude)
-        span.set_attribute("longitude", longitude)
-
-        # Set headers for the request
-        headers = {
-            "User-Agent": config.weather_api.user_agent_alerts,
-            "Accept": config.weather_api.accept_header,
-        }
+    with _span("get_weather_alerts") as span:
+        # Collect span attributes and set them in one call when done
+        attrs: dict[str, Any] = {"latitude": latitude, "longitude": longitude}
 
         try:
             # First, get the zone for the coordinates
-            with tracer.start_as_current_span("get_zone_info") as zone_span:
-                points_url = (
-                    f"{config.weather_api.base_url}/points/{latitude},{longitude}"
-                )
-                zone_span.set_attribute("url", points_url)
-                logger.debug(f"Requesting zone data from: {points_url}")
-                points_response = _http_session.get(
-                    points_url, headers=headers, timeout=config.weather_api.timeout
-                )
-                zone_span.set_attribute("status_code", points_response.status_code)
+            grid, status_code = _get_points(latitude, longitude, _ALERTS_HEADERS, attrs)
 
-                if points_response.status_code != 200:
-                    error_msg = (
-                        f"Failed to get zone data: {points_response.status_code}"
-                    )
-                    logger.error(error_msg)
-                    span.set_attribute("error", error_msg)
-                    return [
-                        {
-                            "error": "Failed to get zone data",
-                            "status": points_response.status_code,
-                        }
-                    ]
-
-            points_data = points_response.json()
+            if grid is None:
+                return [
+                    {
+                        "error": "Failed to get zone data",
+                        "status": _record_failure(status_code, attrs, "zone"),
+                    }
+                ]
 
-            # Get the county/zone code
-            county_zone = points_data["properties"]["county"].split("/")[-1]
-            logger.debug(f"Found county/zone code: {county_zone}")
+            if grid.county_zone is None:
+                attrs["error"] = "No zone for location"
+                return [{"error": "No alert zone available for this location"}]
 
             # Get active alerts for the zone
-            with tracer.start_as_current_span("get_alerts_data") as alerts_span:
-                alerts_url = (
-                    f"{config.weather_api.base_url}/alerts/active/zone/{county_zone}"
-                )
-                alerts_span.set_attribute("url", alerts_url)
-                logger.debug(f"Requesting alerts data from: {alerts_url}")
-                alerts_response = _http_session.get(
-                    alerts_url, headers=headers, timeout=config.weather_api.timeout
-                )
-                alerts_span.set_attribute("status_code", alerts_response.status_code)
+            logger.debug("Found county/zone code: %s", grid.county_zone)
+            return _get_zone_alerts(grid.county_zone, _ALERTS_HEADERS, attrs)
 
-                if alerts_response.status_code != 200:
-                    error_msg = (
-                        f"Failed to get alerts data: {alerts_response.status_code}"
-                    )
-                    logger.error(error_msg)
-                    span.set_attribute("error", error_msg)
-                    return [
-                        {
-                            "error": "Failed to get alerts data",
-                            "status": alerts_response.status_code,
-                        }
-                    ]
-
-            alerts_data = alerts_response.json()
-
-            # Process and format the alerts
-            alerts = []
-            for feature in alerts_data.get("features", []):
-                properties = feature.get("properties", {})
-
-                # Convert effective and expires times to more readable format
-                effective = properties.get("effective")
-                expires = properties.get("expires")
-
-                try:
-                    if effective:
-                        effective_dt = datetime.fromisoformat(
-                            effective.replace("Z", "+00:00")
-                        )
-                        effective = effective_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
-
-                    if expires:
-                        expires_dt = datetime.fromisoformat(
-                            expires.replace("Z", "+00:00")
-                        )
-                        expires = expires_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
-                except Exception as date_error:
-                    logger.warning(f"Error parsing date: {date_error}")
-                    # Keep original format if parsing fails
-                    pass
-
-                alert = {
-                    "event": properties.get("event"),
-                    "headline": properties.get("headline"),
-                    "description": properties.get("description"),
-                    "severity": properties.get("severity"),
-                    "urgency": properties.get("urgency"),
-                    "effective": effective,
-                    "expires": expires,
-                    "instruction": properties.get("instruction"),
+        except Exception as e:
+            # Record the error in the span
+            error_msg = f"Error fetching weather alerts: {str(e)}"
+            logger.error(error_msg)
+            attrs["error"] = str(e)
+            span.record_exception(e)
+            return [{"error": error_msg}]
+
+        finally:
+            span.set_attributes(attrs)
+
+
+def _merge_fetch_attrs(attrs: dict[str, Any], *fetch_attrs: dict[str, Any]) -> None:
+    """Merge span attributes recorded by concurrent fetches into the tool's.
+
+    Each fetch may record its own "error"; all of them are kept, joined in
+    fetch order.
+
+    Args:
+        attrs: Span attributes of the calling tool, updated in place
+        *fetch_attrs: Attributes recorded by each fetch
+    """
+    errors = [fetch["error"] for fetch in fetch_attrs if "error" in fetch]
+    for fetch in fetch_attrs:
+        attrs.update(fetch)
+    if errors:
+        attrs["error"] = "; ".join(errors)
+
+
+@tool
+def get_weather_and_alerts(latitude: float, longitude: float) -> dict[str, Any]:
+    """Get weather information and active alerts for a location
+
+    Get current weather and active weather alerts for the specified coordinates in one call using the National Weather Service API. The forecast and alerts are fetched concurrently after a single grid lookup.
+
+    Args:
+        latitude: The latitude coordinate
+        longitude: The longitude coordinate
+
+    Returns:
+        A dictionary with "weather" (as returned by get_weather) and "alerts"
+        (as returned by get_alerts) entries
+    """
+    logger.info(
+        "Getting weather and alerts for coordinates: %s, %s", latitude, longitude
+    )
+
+    # Create a span covering the grid lookup and both concurrent fetches
+    with _span("get_weather_and_alerts_api") as span:
+        # Collect span attributes and set them in one call when done
+        attrs: dict[str, Any] = {"latitude": latitude, "longitude": longitude}
+
+        try:
+            # One grid lookup serves both the forecast and the alerts
+            grid, status_code = _get_points(
+                latitude, longitude, _WEATHER_HEADERS, attrs
+            )
+
+            if grid is None:
+                return {
+                    "error": "Failed to get grid data",
+                    "status": _record_failure(status_code, attrs, "grid"),
                 }
-                alerts.append(alert)
 
-            # Add count to span
-            alert_count = len(alerts)
-            span.set_attribute("alert_count", alert_count)
+            if grid.forecast_url is None or grid.county_zone is None:
+                attrs["error"] = "Incomplete grid data for location"
+                return {
+                    "error": "No forecast or alert zone available for this location"
+                }
 
-            # If no alerts, return a clear message
-            if not alerts:
-                logger.info("No active weather alerts found for this location")
-                return [{"message": "No active weather alerts for this location"}]
+            # Fetch forecast and alerts concurrently; each worker runs in its own
+            # copy of the current context so instrumented HTTP spans and log
+            # correlation stay attached to this tool's trace, and records its
+            # attributes separately so one failure cannot overwrite the other
+            forecast_attrs: dict[str, Any] = {}
+            alerts_attrs: dict[str, Any] = {}
+            forecast_future = _http_executor.submit(
+                contextvars.copy_context().run,
+                _get_forecast,
+                grid.forecast_url,
+                _WEATHER_HEADERS,
+                forecast_attrs,
+            )
+            alerts_future = _http_executor.submit(
+                contextvars.copy_context().run,
+                _get_zone_alerts,
+                grid.county_zone,
+                _ALERTS_HEADERS,
+                alerts_attrs,
+            )
+            # Let both workers finish before their attributes are merged
+            wait((forecast_future, alerts_future))
+            _merge_fetch_attrs(attrs, forecast_attrs, alerts_attrs)
 
-            logger.info(f"Found {alert_count} active weather alert(s)")
-            return alerts
+            return {
+                "weather": forecast_future.result(),
+                "alerts": alerts_future.result(),
+            }
 
         except Exception as e:
             # Record the error in the span
-            error_msg = f"Error fetching weather alerts: {str(e)}"
+            error_msg = f"Error fetching weather and alerts: {str(e)}"
             logger.error(error_msg)
-            span.set_attribute("error", str(e))
+            attrs["error"] = str(e)
             span.record_exception(e)
-            return [{"error": error_msg}]
+            return {"error": error_msg}
+
+        finally:
+            span.set_attributes(attrs)
+
+
+# Local tools per deployment mode; MCP tools are appended at client creation
+_BEDROCK_AGENT_TOOLS = (current_time, get_weather, get_alerts)
+_DIRECT_TOOLS = (current_time, get_weather, get_alerts, get_weather_and_alerts)
 
 
 @dataclass
@@ -376,16 +741,17 @@ class LocationWeatherClient:
         deployment_config = self._create_deployment_config(
             deployment_mode, config_override, model_id, region_name
         )
-        # Get the tracer for this module
-        tracer = trace.get_tracer(__name__)
-
         # Create a span for the initialization process
-        with tracer.start_as_current_span("agent_initialization") as span:
+        with _span("agent_initialization") as span:
             try:
-                logger.info(f"Initializing model for {deployment_mode.value} mode")
-                span.set_attribute("deployment_mode", deployment_mode.value)
-                span.set_attribute("model_id", deployment_config.bedrock_model_id)
-                span.set_attribute("region_name", deployment_config.aws_region)
+                logger.info("Initializing model for %s mode", deployment_mode.value)
+                span.set_attributes(
+                    {
+                        "deployment_mode": deployment_mode.value,
+                        "model_id": deployment_config.bedrock_model_id,
+                        "region_name": deployment_config.aws_region,
+                    }
+                )
 
                 # Create model using factory (handles different deployment modes)
                 model = ModelFactory.create_model(deployment_config)
@@ -393,7 +759,8 @@ class LocationWeatherClient:
                 # Get tools based on deployment mode
                 all_tools = self._get_tools_for_mode(deployment_mode)
                 tool_count = len(all_tools)
-                logger.info(f"Registered {tool_count} tools")
+                self._tools = all_tools
+                logger.info("Registered %d tools", tool_count)
                 span.set_attribute("tool_count", tool_count)
 
                 # Use the provided system prompt or the default one
@@ -407,10 +774,12 @@ class LocationWeatherClient:
                     # Store configuration for Bedrock Agent runtime invocation
                     self._bedrock_agent_id = deployment_config.bedrock_agent_id
                     self._bedrock_agent_region = deployment_config.aws_region
+                    self._bedrock_agent_client = None  # Created on first chat
                     self._bedrock_agent_model = model
                     self.agent = None  # No direct agent for BEDROCK_AGENT mode
                     logger.info(
-                        f"Configured for Bedrock Agent runtime: {self._bedrock_agent_id}"
+                        "Configured for Bedrock Agent runtime: %s",
+                        self._bedrock_agent_id,
                     )
                 else:
                     # LOCAL and MCP modes use direct agent
@@ -420,10 +789,9 @@ class LocationWeatherClient:
                         system_prompt=prompt_to_use,
                     )
                     logger.info("Agent created successfully")
-                logger.info("Agent created successfully")
 
             except Exception as e:
-                logger.error(f"Error initializing LocationWeatherClient: {e}")
+                logger.error("Error initializing LocationWeatherClient: %s", e)
                 span.record_exception(e)
                 raise
 
@@ -436,18 +804,17 @@ class LocationWeatherClient:
         Returns:
             Agent response as a string
         """
-        logger.info(f"Processing prompt: {prompt}")
-
-        # Get the tracer for this module
-        tracer = trace.get_tracer(__name__)
+        logger.info("Processing prompt: %s", prompt)
 
         # Create a span for the entire agent interaction
-        with tracer.start_as_current_span("agent_interaction") as span:
+        with _span("agent_interaction") as span:
             try:
-                # Add the prompt as an attribute
-                span.set_attribute("prompt", prompt)
-                span.set_attribute("prompt_length", len(prompt))
-                span.set_attribute("deployment_mode", self._deployment_mode.value)
+                # Add the prompt as an attribute, capped so long prompts do not
+                # bloat exported spans (prompt_length keeps the full size)
+                if span.is_recording():
+                    span.set_attribute("prompt", prompt[:_PROMPT_ATTR_MAX_LENGTH])
+                    span.set_attribute("prompt_length", len(prompt))
+                    span.set_attribute("deployment_mode", self._deployment_mode.value)
 
                 # Handle different deployment modes
                 if self._deployment_mode == DeploymentMode.BEDROCK_AGENT:
@@ -456,7 +823,7 @@ class LocationWeatherClient:
                     return self._invoke_direct_agent(prompt, span)
 
             except Exception as e:
-                logger.error(f"Agent interaction failed: {e}")
+                logger.error("Agent interaction failed: %s", e)
                 span.record_exception(e)
                 span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
                 # Return a user-friendly error message
@@ -464,59 +831,49 @@ class LocationWeatherClient:
 
     def _invoke_direct_agent(self, prompt: str, span) -> str:
         """Invoke agent directly for LOCAL and MCP modes."""
-        tracer = trace.get_tracer(__name__)
-        with tracer.start_as_current_span("bedrock_model_inference") as model_span:
-            # Set model ID attribute from config
-            model_span.set_attribute("model_id", config.bedrock.model_id)
+        with _span("bedrock_model_inference") as model_span:
+            # Set model ID attribute from config; metrics are added in one batch
+            model_attrs: dict[str, Any] = {"model_id": config.bedrock.model_id}
 
             try:
                 result = self.agent(prompt)
 
-                # Process metrics from the result object while span is still active
-                if hasattr(result, "metrics"):
+                # Process metrics from the result object while span is still active;
+                # skipped entirely when the span is not being recorded
+                metrics = (
+                    getattr(result, "metrics", None)
+                    if model_span.is_recording()
+                    else None
+                )
+                if metrics is not None:
                     try:
                         # Add token usage metrics
-                        if hasattr(result.metrics, "accumulated_usage") and isinstance(
-                            result.metrics.accumulated_usage, dict
-                        ):
-                            for key, value in result.metrics.accumulated_usage.items():
+                        usage = getattr(metrics, "accumulated_usage", None)
+                        if isinstance(usage, dict):
+                            for key, value in usage.items():
                                 # Only set attributes for compatible types
-                                if isinstance(value, str | bool | int | float):
-                                    model_span.set_attribute(f"metrics.{key}", value)
+                                if isinstance(value, _OTEL_ATTR_TYPES):
+                                    model_attrs[f"metrics.{key}"] = value
 
                         # Add execution time metrics
-                        if (
-                            hasattr(result.metrics, "cycle_durations")
-                            and result.metrics.cycle_durations
-                        ):
-                            total_duration = sum(result.metrics.cycle_durations)
-                            model_span.set_attribute(
-                                "metrics.total_duration", total_duration
-                            )
-                            model_span.set_attribute(
-                                "metrics.cycle_count",
-                                len(result.metrics.cycle_durations),
-                            )
+                        cycle_durations = getattr(metrics, "cycle_durations", None)
+                        if cycle_durations:
+                            model_attrs["metrics.total_duration"] = sum(cycle_durations)
+                            model_attrs["metrics.cycle_count"] = len(cycle_durations)
 
                         # Add tool usage metrics
-                        if (
-                            hasattr(result.metrics, "tool_metrics")
-                            and result.metrics.tool_metrics
-                        ):
-                            tools_used = list(result.metrics.tool_metrics.keys())
-                            model_span.set_attribute(
-                                "metrics.tools_used", ", ".join(tools_used)
-                            )
-                            model_span.set_attribute(
-                                "metrics.tool_count", len(tools_used)
-                            )
+                        tool_metrics = getattr(metrics, "tool_metrics", None)
+                        if tool_metrics:
+                            tools_used = list(tool_metrics.keys())
+                            model_attrs["metrics.tools_used"] = ", ".join(tools_used)
+                            model_attrs["metrics.tool_count"] = len(tools_used)
                     except Exception as metrics_error:
                         # Don't fail the whole request if metrics processing fails
-                        logger.warning(f"Failed to process metrics: {metrics_error}")
-                        model_span.set_attribute("metrics.error", str(metrics_error))
+                        logger.warning("Failed to process metrics: %s", metrics_error)
+                        model_attrs["metrics.error"] = str(metrics_error)
 
             except Exception as model_error:
-                logger.error(f"Model inference failed: {model_error}")
+                logger.error("Model inference failed: %s", model_error)
                 model_span.record_exception(model_error)
                 model_span.set_status(
                     trace.Status(trace.StatusCode.ERROR, str(model_error))
@@ -524,9 +881,13 @@ class LocationWeatherClient:
                 # Re-raise to be handled by outer try/except
                 raise
 
+            finally:
+                model_span.set_attributes(model_attrs)
+
         # Add response attributes to the span
         response_text = str(result)
-        span.set_attribute("response_length", len(response_text))
+        if span.is_recording():
+            span.set_attribute("response_length", len(response_text))
 
         logger.info("Direct agent interaction completed successfully")
         return response_text
@@ -534,16 +895,18 @@ class LocationWeatherClient:
     def _invoke_bedrock_agent(self, prompt: str, span) -> str:
         """Invoke Bedrock Agent for BEDROCK_AGENT mode."""
 
-        tracer = trace.get_tracer(__name__)
-        with tracer.start_as_current_span("bedrock_agent_invocation") as agent_span:
+        with _span("bedrock_agent_invocation") as agent_span:
             agent_span.set_attribute("agent_id", self._bedrock_agent_id)
 
             try:
-                # Create Bedrock Agent Runtime client
-                bedrock_agent_client = boto3.client(
-                    "bedrock-agent-runtime",
-                    region_name=self._bedrock_agent_region,
-                )
+                # Create the Bedrock Agent Runtime client once per instance
+                bedrock_agent_client = self._bedrock_agent_client
+                if bedrock_agent_client is None:
+                    bedrock_agent_client = self._bedrock_agent_client = boto3.client(
+                        "bedrock-agent-runtime",
+                        region_name=self._bedrock_agent_region,
+                        config=_BEDROCK_AGENT_CLIENT_CONFIG,
+                    )
 
                 # Generate session ID
                 session_id = str(uuid.uuid4())
@@ -556,15 +919,16 @@ class LocationWeatherClient:
                     inputText=prompt,
                 )
 
-                # Process streaming response
-                response_text = ""
+                # Process streaming response; chunks are joined and decoded once,
+                # which also keeps multi-byte characters split across chunks intact
+                parts: list[bytes] = []
                 if "completion" in response:
                     for event in response["completion"]:
                         if "chunk" in event:
                             chunk = event["chunk"]
                             if "bytes" in chunk:
-                                chunk_text = chunk["bytes"].decode("utf-8")
-                                response_text += chunk_text
+                                parts.append(chunk["bytes"])
+                response_text = b"".join(parts).decode("utf-8")
 
                 agent_span.set_attribute("response_length", len(response_text))
                 logger.info("Bedrock Agent invocation completed successfully")
@@ -583,9 +947,19 @@ class LocationWeatherClient:
     def get_deployment_info(self) -> DeploymentInfo:
         """Get information about the current deployment configuration.
 
+        The configuration does not change after initialization, so the result
+        is built on first use and reused by later (e.g. status endpoint) calls.
+
         Returns:
             DeploymentInfo with current configuration details
         """
+        info = getattr(self, "_deployment_info", None)
+        if info is None:
+            info = self._deployment_info = self._build_deployment_info()
+        return info
+
+    def _build_deployment_info(self) -> DeploymentInfo:
+        """Inspect the configured model and tools to build DeploymentInfo."""
         # Use the stored deployment mode
         mode = getattr(self, "_deployment_mode", DeploymentMode.LOCAL)
 
@@ -621,24 +995,9 @@ class LocationWeatherClient:
                 ):
                     region = getattr(model.client.meta, "region_name", None)
 
-        # Count tools based on deployment mode
-        tools_count = 0
-        if mode == DeploymentMode.BEDROCK_AGENT:
-            # BEDROCK_AGENT mode: Base tools only (3: current_time, get_weather, get_alerts)
-            # Location services are handled by Bedrock Agent action groups
-            tools_count = 3
-        else:
-            # LOCAL and MCP modes: Count tools from agent
-            if (
-                hasattr(self, "agent")
-                and self.agent
-                and hasattr(self.agent, "tool_registry")
-            ):
-                try:
-                    tools_config = self.agent.tool_registry.get_all_tools_config()
-                    tools_count = len(tools_config) if tools_config else 0
-                except Exception:
-                    tools_count = 0
+        # Count the tools resolved at initialization; in BEDROCK_AGENT mode these
+        # are the base tools only, as location services are agent action groups
+        tools_count = len(getattr(self, "_tools", ()))
 
         return DeploymentInfo(
             mode=mode,
@@ -753,8 +1112,8 @@ class LocationWeatherClient:
         if mode == DeploymentMode.BEDROCK_AGENT:
             # BEDROCK_AGENT mode: Only base tools (no MCP tools)
             # Location services are handled by Bedrock Agent action groups
-            return [current_time, get_weather, get_alerts]
+            return list(_BEDROCK_AGENT_TOOLS)
         else:
             # LOCAL and MCP modes: Include MCP tools for location services
             _initialize_mcp_client()
-            return [current_time, get_weather, get_alerts] + mcp_tools
+            return [*_DIRECT_TOOLS, *mcp_tools]
@@ -10,22 +10,31 @@ from opentelemetry.instrumentation.logging import LoggingInstrumentor
 from opentelemetry.instrumentation.requests import RequestsInstrumentor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 
 from .config import config
 
 # Configure OpenTelemetry FIRST
 resource = Resource.create({"service.name": config.opentelemetry.service_name})
-tracer_provider = TracerProvider(resource=resource)
+# Head-sample whole interactions; child spans (tools, model calls) follow the
+# root span's decision, and unsampled spans skip attribute recording and export
+tracer_provider = TracerProvider(
+    resource=resource,
+    sampler=ParentBased(TraceIdRatioBased(config.opentelemetry.trace_sample_rate)),
+)
 trace.set_tracer_provider(tracer_provider)
 
 # Configure exporters based on environment
 if config.opentelemetry.development_mode:
-    # In development: Use SimpleSpanProcessor for immediate console output
+    # In development: Export to the console from a background thread so span
+    # ends never block a tool call; a short delay keeps output near-immediate
     console_exporter = ConsoleSpanExporter()
-    tracer_provider.add_span_processor(SimpleSpanProcessor(console_exporter))
+    tracer_provider.add_span_processor(
+        BatchSpanProcessor(console_exporter, schedule_delay_millis=500)
+    )
 else:
-    # Production exporter setup would go here
+    # Production exporter setup would go here (wrap it in a BatchSpanProcessor)
     pass
 
 # Get a tracer for this module
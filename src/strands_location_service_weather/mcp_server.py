@@ -5,8 +5,11 @@ This creates a FastMCP server that wraps the existing LocationWeatherClient
 with comprehensive error handling and OpenTelemetry observability.
 """
 
+import asyncio
 import os
 import sys
+import threading
+import time
 
 from fastmcp import FastMCP
 from opentelemetry import trace
@@ -18,6 +21,9 @@ from .location_weather import LocationWeatherClient
 # Get tracer for OpenTelemetry spans
 tracer = trace.get_tracer(__name__)
 
+# Per-query time limit, kept under Q CLI's 120s tool timeout
+QUERY_TIMEOUT_SECONDS = 90
+
 # Initialize FastMCP server with performance optimizations
 mcp = FastMCP(
     "Location Weather Service",
@@ -25,50 +31,112 @@ mcp = FastMCP(
     mask_error_details=False,  # Keep detailed errors for debugging
 )
 
-# Global client instance - pre-initialize at startup
+# Global client instance - pre-initialized when the server starts, so importing
+# this module (tests, tooling) does not build a Bedrock model or spawn MCP tools
 _debug = os.getenv("DEVELOPMENT", "false").lower() == "true"
+_client = None
+_client_lock = threading.Lock()
 
-if _debug:
-    print(
-        "DEBUG: Pre-initializing LocationWeatherClient at startup",
-        file=sys.stderr,
-        flush=True,
-    )
+# MCP error handlers are stateless, so one instance serves every tool call
+_error_handler = ErrorHandlerFactory.create_handler(DeploymentMode.MCP)
 
-try:
-    _client = LocationWeatherClient()
-    if _debug:
-        print(
-            "DEBUG: LocationWeatherClient initialized successfully",
-            file=sys.stderr,
-            flush=True,
-        )
-except Exception as e:
+# The shared client's agent rejects concurrent invocations, so chats on it are
+# serialized; a chat that overruns its deadline keeps the lock until it returns
+_chat_lock = threading.Lock()
+
+
+def _preinitialize_client():
+    """Create the LocationWeatherClient ahead of the first query.
+
+    Failures are not fatal; get_client retries on the first tool call.
+    """
     if _debug:
         print(
-            f"DEBUG: Failed to initialize LocationWeatherClient: {e}",
+            "DEBUG: Pre-initializing LocationWeatherClient at startup",
             file=sys.stderr,
             flush=True,
         )
-    _client = None
-
 
-def get_client():
-    """Get the pre-initialized LocationWeatherClient."""
-    global _client, _debug
-    if _client is None:
+    try:
+        get_client()
         if _debug:
             print(
-                "DEBUG: Client was None, attempting to re-initialize",
+                "DEBUG: LocationWeatherClient initialized successfully",
                 file=sys.stderr,
                 flush=True,
             )
-        _client = LocationWeatherClient()
+    except Exception as e:
+        if _debug:
+            print(
+                f"DEBUG: Failed to initialize LocationWeatherClient: {e}",
+                file=sys.stderr,
+                flush=True,
+            )
+
+
+def _timeout_error() -> TimeoutError:
+    """Build the error raised when a query misses its deadline."""
+    return TimeoutError(
+        f"Query processing timed out after {QUERY_TIMEOUT_SECONDS} seconds"
+    )
+
+
+def _serialized_chat(client, query: str, deadline: float) -> str:
+    """Run a chat on the shared client, one at a time.
+
+    A chat that cannot start before the deadline (a time.monotonic() value)
+    is skipped, so queries that already timed out never reach the agent.
+    """
+    if not _chat_lock.acquire(timeout=max(deadline - time.monotonic(), 0)):
+        raise _timeout_error()
+    try:
+        return client.chat(query)
+    finally:
+        _chat_lock.release()
+
+
+async def _chat_before_deadline(client, query: str, deadline: float) -> str:
+    """Run a serialized chat in a worker thread, bounded by the deadline."""
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(_serialized_chat, client, query, deadline),
+            timeout=max(deadline - time.monotonic(), 0),
+        )
+    except asyncio.TimeoutError as e:
+        raise _timeout_error() from e
+
+
+def _report_error(exception: Exception, tool_name: str, **metadata) -> None:
+    """Record a tool error with the MCP error handler."""
+    _error_handler.handle_error(
+        exception=exception,
+        context=create_error_context(
+            deployment_mode=DeploymentMode.MCP,
+            tool_name=tool_name,
+            metadata=metadata,
+        ),
+        tool_name=tool_name,
+    )
+
+
+def get_client():
+    """Get the shared LocationWeatherClient, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if _debug:
+                    print(
+                        "DEBUG: Client was None, attempting to initialize",
+                        file=sys.stderr,
+                        flush=True,
+                    )
+                _client = LocationWeatherClient()
     return _client
 
 
 @mcp.tool()
-def ask_location_weather(query: str) -> str:
+async def ask_location_weather(query: str) -> str:
     """Ask questions about locations, weather, routes, and places.
 
     Supports natural language queries like:
@@ -84,19 +152,10 @@ def ask_location_weather(query: str) -> str:
         Response with location and weather information
     """
     if not query:
-        # Create error context for validation error
-        error_context = create_error_context(
-            deployment_mode=DeploymentMode.MCP,
-            tool_name="ask_location_weather",
-            metadata={"query": query},
-        )
-
-        # Handle validation error with MCP error handler
-        error_handler = ErrorHandlerFactory.create_handler(DeploymentMode.MCP)
-        error_handler.handle_error(
-            exception=ValueError("Query parameter is required"),
-            context=error_context,
-            tool_name="ask_location_weather",
+        _report_error(
+            ValueError("Query parameter is required"),
+            "ask_location_weather",
+            query=query,
         )
 
         # Return user-friendly error message for MCP
@@ -109,12 +168,12 @@ def ask_location_weather(query: str) -> str:
             attributes={
                 "mcp.tool_name": "ask_location_weather",
                 "mcp.query_length": len(query),
+                "deployment_mode": DeploymentMode.MCP.value,
             },
         ) as span:
-            span.set_attribute("mcp.tool_name", "ask_location_weather")
-            span.set_attribute("mcp.query_length", len(query))
-            span.set_attribute("deployment_mode", DeploymentMode.MCP.value)
-
+            # Only copy the truncated query for spans that are actually recorded
+            if span.is_recording():
+                span.set_attribute("mcp.query", query[:100])  # Truncate for privacy
             if _debug:
                 print(f"DEBUG: Processing query: {query}", file=sys.stderr, flush=True)
                 span.set_attribute("mcp.debug_mode", True)
@@ -123,34 +182,17 @@ def ask_location_weather(query: str) -> str:
             if _debug:
                 print("DEBUG: Got client, calling chat", file=sys.stderr, flush=True)
 
-            # Add timeout for complex queries to prevent Q CLI timeouts
-            import signal
-
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Query processing timed out after 90 seconds")
-
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(90)  # 90 second timeout (under Q CLI's 120s limit)
-
-            try:
-                with tracer.start_as_current_span(
-                    "client.chat",
-                    kind=trace.SpanKind.CLIENT,
-                    attributes={
-                        "client.operation": "chat",
-                    },
-                ) as chat_span:
-                    chat_span.set_attribute(
-                        "query", query[:100]
-                    )  # Truncate for privacy
-                    response = client.chat(query)
-                    chat_span.set_attribute("response_length", len(response))
-            finally:
-                signal.alarm(0)  # Cancel the alarm
+            # Run the blocking chat in a worker thread so the server keeps
+            # handling other calls; time out complex queries before Q CLI does.
+            # The client's own spans nest directly under this one.
+            response = await _chat_before_deadline(
+                client, query, time.monotonic() + QUERY_TIMEOUT_SECONDS
+            )
 
             # Add success attributes to span
-            span.set_attribute("mcp.success", True)
-            span.set_attribute("mcp.response_length", len(response))
+            span.set_attributes(
+                {"mcp.success": True, "mcp.response_length": len(response)}
+            )
 
             if _debug:
                 print(
@@ -161,39 +203,15 @@ def ask_location_weather(query: str) -> str:
             return response
 
     except TimeoutError as e:
-        # Create error context for timeout
-        error_context = create_error_context(
-            deployment_mode=DeploymentMode.MCP,
-            tool_name="ask_location_weather",
-            metadata={"query": query, "timeout": 90},
-        )
-
-        # Handle timeout error with MCP error handler
-        error_handler = ErrorHandlerFactory.create_handler(DeploymentMode.MCP)
-        error_handler.handle_error(
-            exception=e,
-            context=error_context,
-            tool_name="ask_location_weather",
+        _report_error(
+            e, "ask_location_weather", query=query, timeout=QUERY_TIMEOUT_SECONDS
         )
 
         # Return user-friendly timeout message
         return "Query timed out. Please try asking about individual cities instead of complex routes."
 
     except Exception as e:
-        # Create error context for general error
-        error_context = create_error_context(
-            deployment_mode=DeploymentMode.MCP,
-            tool_name="ask_location_weather",
-            metadata={"query": query},
-        )
-
-        # Handle general error with MCP error handler
-        error_handler = ErrorHandlerFactory.create_handler(DeploymentMode.MCP)
-        error_handler.handle_error(
-            exception=e,
-            context=error_context,
-            tool_name="ask_location_weather",
-        )
+        _report_error(e, "ask_location_weather", query=query)
 
         if _debug:
             print(
@@ -209,8 +227,66 @@ def ask_location_weather(query: str) -> str:
         return f"Error processing query: {str(e)}"
 
 
+@mcp.tool()
+async def batch_ask_location_weather(queries: list[str]) -> list[str]:
+    """Ask several location and weather questions in one call.
+
+    Queries are answered in order by the server's shared client, so asking
+    about several cities costs one round trip instead of one per city. Each
+    query gets its own time limit, as a separate ask_location_weather call
+    would, and later queries see the conversation of the earlier ones.
+
+    Args:
+        queries: Natural language queries, answered in order
+
+    Returns:
+        One response per query, in the same order
+    """
+
+    async def answer(query: str) -> str:
+        if not query:
+            _report_error(
+                ValueError("Query parameter is required"),
+                "batch_ask_location_weather",
+                query=query,
+            )
+            return "Error: Query parameter is required"
+
+        try:
+            return await _chat_before_deadline(
+                get_client(), query, time.monotonic() + QUERY_TIMEOUT_SECONDS
+            )
+        except TimeoutError as e:
+            _report_error(
+                e,
+                "batch_ask_location_weather",
+                query=query,
+                timeout=QUERY_TIMEOUT_SECONDS,
+            )
+            return "Query timed out. Please try asking about individual cities instead of complex routes."
+        except Exception as e:
+            _report_error(e, "batch_ask_location_weather", query=query)
+            return f"Error processing query: {str(e)}"
+
+    with tracer.start_as_current_span(
+        "mcp.tool.batch_ask_location_weather",
+        kind=trace.SpanKind.SERVER,
+        attributes={
+            "mcp.tool_name": "batch_ask_location_weather",
+            "mcp.batch_size": len(queries),
+            "deployment_mode": DeploymentMode.MCP.value,
+        },
+    ) as span:
+        responses = [await answer(query) for query in queries]
+        span.set_attribute(
+            "mcp.response_length", sum(len(response) for response in responses)
+        )
+        return responses
+
+
 def run_mcp_server():
     """Run the FastMCP server."""
+    _preinitialize_client()
     mcp.run()
 
 
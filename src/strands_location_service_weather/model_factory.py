@@ -2,22 +2,67 @@
 Model factory for creating Strands model instances based on deployment configuration.
 """
 
+import copy
+import functools
 import logging
+import re
 
 from strands.models import BedrockModel
 
 from .config import DeploymentConfig, DeploymentMode
+from .config import config as app_config
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
 
+# AWS identifier formats: alphanumerics plus hyphens (and underscores where
+# allowed), with at least one alphanumeric character
+_HYPHENATED_ID_RE = re.compile(r"-*[A-Za-z0-9][A-Za-z0-9-]*")
+_HYPHENATED_UNDERSCORED_ID_RE = re.compile(r"[-_]*[A-Za-z0-9][A-Za-z0-9_-]*")
+
+
 class ModelCreationError(Exception):
     """Exception raised when model creation fails."""
 
     pass
 
 
+@functools.lru_cache(maxsize=16)
+def _get_bedrock_model(
+    model_id: str,
+    region_name: str,
+    guardrail_id: str | None = None,
+    guardrail_version: str | None = None,
+    timeout: int | None = None,
+) -> BedrockModel:
+    """Get a shared BedrockModel for a set of model parameters.
+
+    Models are created once per parameter set so repeated client construction
+    reuses the boto3 session, credential resolution and connection pool.
+
+    Args:
+        model_id: Bedrock model ID
+        region_name: AWS region name
+        guardrail_id: Optional guardrail ID
+        guardrail_version: Guardrail version, used with guardrail_id
+        timeout: Optional request timeout in seconds
+
+    Returns:
+        Cached BedrockModel instance
+    """
+    # Build model parameters following Strands SDK best practices
+    model_params = {"model_id": model_id, "region_name": region_name}
+    if guardrail_id:
+        model_params["guardrail_id"] = guardrail_id
+        model_params["guardrail_version"] = guardrail_version
+    if timeout:
+        model_params["timeout"] = timeout
+
+    logger.info("BedrockModel parameters: %s", model_params)
+    return BedrockModel(**model_params)
+
+
 class ModelFactory:
     """Factory class for creating Strands BedrockModel instances based on deployment configuration."""
 
@@ -35,7 +80,7 @@ class ModelFactory:
             ModelCreationError: If model creation fails
             ValueError: If configuration is invalid
         """
-        logger.info(f"Creating model for deployment mode: {config.mode.value}")
+        logger.info("Creating model for deployment mode: %s", config.mode.value)
 
         try:
             # Validate configuration first
@@ -68,34 +113,28 @@ class ModelFactory:
             ModelCreationError: If BedrockModel creation fails
         """
         logger.info(
-            f"Creating BedrockModel with model_id={config.bedrock_model_id}, region={config.aws_region}"
+            "Creating BedrockModel with model_id=%s, region=%s",
+            config.bedrock_model_id,
+            config.aws_region,
         )
 
         try:
-            # Build model parameters following Strands SDK best practices
-            model_params = {
-                "model_id": config.bedrock_model_id,
-                "region_name": config.aws_region,
-            }
-
-            # Add optional configuration parameters if available
-            from .config import config as app_config
+            guardrail_id = guardrail_version = None
 
             # Add guardrail configuration if available (Bedrock models can use guardrails too)
-            if hasattr(app_config, "guardrail") and app_config.guardrail.guardrail_id:
-                guardrail_config = app_config.guardrail
-                model_params["guardrail_id"] = guardrail_config.guardrail_id
-                model_params["guardrail_version"] = guardrail_config.guardrail_version
-                logger.info(
-                    f"Adding guardrail configuration: {guardrail_config.guardrail_id}"
-                )
-
-            # Add timeout configuration if specified
-            if hasattr(config, "timeout") and config.timeout:
-                model_params["timeout"] = config.timeout
-
-            logger.info(f"BedrockModel parameters: {model_params}")
-            model = BedrockModel(**model_params)
+            guardrail_config = getattr(app_config, "guardrail", None)
+            if guardrail_config and guardrail_config.guardrail_id:
+                guardrail_id = guardrail_config.guardrail_id
+                guardrail_version = guardrail_config.guardrail_version
+                logger.info("Adding guardrail configuration: %s", guardrail_id)
+
+            model = _get_bedrock_model(
+                config.bedrock_model_id,
+                config.aws_region,
+                guardrail_id,
+                guardrail_version,
+                getattr(config, "timeout", None),
+            )
 
             logger.info("BedrockModel created successfully")
             return model
@@ -126,30 +165,29 @@ class ModelFactory:
             raise ValueError("bedrock_agent_id is required for BEDROCK_AGENT mode")
 
         logger.info(
-            f"Creating BedrockModel for Bedrock Agent runtime with agent_id={config.bedrock_agent_id}"
+            "Creating BedrockModel for Bedrock Agent runtime with agent_id=%s",
+            config.bedrock_agent_id,
         )
 
         try:
             # For BEDROCK_AGENT mode, we create a BedrockModel but store the agent_id
-            # The actual agent invocation will be handled by the LocationWeatherClient
-            model_params = {
-                "model_id": config.bedrock_model_id,
-                "region_name": config.aws_region,
-            }
-
-            # Add timeout configuration if specified
-            if hasattr(config, "timeout") and config.timeout:
-                model_params["timeout"] = config.timeout
-
-            logger.info(f"BedrockModel parameters for agent runtime: {model_params}")
-            model = BedrockModel(**model_params)
+            # The actual agent invocation will be handled by the LocationWeatherClient.
+            # The shared model is copied so the agent attributes stay per-instance.
+            model = copy.copy(
+                _get_bedrock_model(
+                    config.bedrock_model_id,
+                    config.aws_region,
+                    timeout=getattr(config, "timeout", None),
+                )
+            )
 
             # Store the agent_id as a custom attribute for later use
             model._bedrock_agent_id = config.bedrock_agent_id
             model._deployment_mode = DeploymentMode.BEDROCK_AGENT
 
             logger.info(
-                f"BedrockModel created for Bedrock Agent runtime: {config.bedrock_agent_id}"
+                "BedrockModel created for Bedrock Agent runtime: %s",
+                config.bedrock_agent_id,
             )
             return model
 
@@ -175,7 +213,7 @@ class ModelFactory:
         Raises:
             ValueError: If configuration is invalid
         """
-        logger.info(f"Validating model configuration for mode: {config.mode.value}")
+        logger.info("Validating model configuration for mode: %s", config.mode.value)
 
         # Validate common configuration
         if not config.bedrock_model_id:
@@ -185,7 +223,7 @@ class ModelFactory:
             raise ValueError("aws_region is required")
 
         # Validate AWS region format (basic check)
-        if not config.aws_region.replace("-", "").replace("_", "").isalnum():
+        if not _HYPHENATED_UNDERSCORED_ID_RE.fullmatch(config.aws_region):
             raise ValueError(f"Invalid AWS region format: {config.aws_region}")
 
         # Validate mode-specific configuration
@@ -194,30 +232,29 @@ class ModelFactory:
                 raise ValueError("bedrock_agent_id is required for BEDROCK_AGENT mode")
 
             # Validate Bedrock agent ID format (should be alphanumeric with possible hyphens)
-            if not config.bedrock_agent_id.replace("-", "").isalnum():
+            if not _HYPHENATED_ID_RE.fullmatch(config.bedrock_agent_id):
                 raise ValueError(
                     f"Invalid Bedrock agent ID format: {config.bedrock_agent_id}"
                 )
 
             # Check for additional Bedrock agent configuration
-            from .config import config as app_config
-
-            if hasattr(app_config, "bedrock_agent"):
-                bedrock_agent_config = app_config.bedrock_agent
-
+            bedrock_agent_config = getattr(app_config, "bedrock_agent", None)
+            if bedrock_agent_config:
                 # Validate agent alias ID if present
                 if (
                     bedrock_agent_config.agent_alias_id
-                    and not bedrock_agent_config.agent_alias_id.replace("-", "")
-                    .replace("_", "")
-                    .isalnum()
+                    and not _HYPHENATED_UNDERSCORED_ID_RE.fullmatch(
+                        bedrock_agent_config.agent_alias_id
+                    )
                 ):
                     raise ValueError(
                         f"Invalid Bedrock agent alias ID format: {bedrock_agent_config.agent_alias_id}"
                     )
 
                 logger.info(
-                    f"Bedrock agent configuration validated: alias_id={bedrock_agent_config.agent_alias_id}, trace_enabled={bedrock_agent_config.enable_trace}"
+                    "Bedrock agent configuration validated: alias_id=%s, trace_enabled=%s",
+                    bedrock_agent_config.agent_alias_id,
+                    bedrock_agent_config.enable_trace,
                 )
 
         # Validate Bedrock model ID format for both modes
@@ -229,17 +266,15 @@ class ModelFactory:
                 )
 
         # Validate guardrail configuration if present
-        from .config import config as app_config
-
-        if hasattr(app_config, "guardrail") and app_config.guardrail.guardrail_id:
-            guardrail_config = app_config.guardrail
-            if not guardrail_config.guardrail_id.replace("-", "").isalnum():
+        guardrail_config = getattr(app_config, "guardrail", None)
+        if guardrail_config and guardrail_config.guardrail_id:
+            if not _HYPHENATED_ID_RE.fullmatch(guardrail_config.guardrail_id):
                 raise ValueError(
                     f"Invalid guardrail ID format: {guardrail_config.guardrail_id}"
                 )
 
             logger.info(
-                f"Guardrail configuration validated: {guardrail_config.guardrail_id}"
+                "Guardrail configuration validated: %s", guardrail_config.guardrail_id
             )
 
         logger.info("Model configuration is valid")
@@ -257,28 +292,31 @@ class ModelFactory:
         Returns:
             True if model is healthy, False otherwise
         """
-        logger.info(f"Performing health check for model type: {type(model).__name__}")
+        logger.info("Performing health check for model type: %s", type(model).__name__)
 
         try:
             if isinstance(model, BedrockModel):
-                # Verify BedrockModel has required attributes
-                required_attrs = ["model_id", "region_name"]
-                for attr in required_attrs:
-                    if not hasattr(model, attr):
-                        logger.warning(
-                            f"BedrockModel missing required attribute: {attr}"
-                        )
-                        return False
+                # Verify BedrockModel has a model ID and a regional client
+                try:
+                    model_id = model.get_config()["model_id"]
+                    region_name = model.client.meta.region_name
+                except (AttributeError, KeyError) as e:
+                    logger.warning("BedrockModel missing required configuration: %s", e)
+                    return False
+
+                if not model_id or not region_name:
+                    logger.warning("BedrockModel has no model_id or region configured")
+                    return False
 
                 logger.info(
-                    f"BedrockModel health check passed for model_id: {model.model_id}"
+                    "BedrockModel health check passed for model_id: %s", model_id
                 )
                 return True
 
             else:
-                logger.warning(f"Unknown model type: {type(model).__name__}")
+                logger.warning("Unknown model type: %s", type(model).__name__)
                 return False
 
         except Exception as e:
-            logger.error(f"Model health check failed with exception: {str(e)}")
+            logger.error("Model health check failed with exception: %s", e)
             return False
@@ -764,7 +764,12 @@ class ToolManager:
         logger.info(f"Getting tools for deployment mode: {mode.value}")
 
         # Import tools here to avoid circular imports
-        from .location_weather import current_time, get_alerts, get_weather
+        from .location_weather import (
+            current_time,
+            get_alerts,
+            get_weather,
+            get_weather_and_alerts,
+        )
 
         # Base tools available in all modes (custom weather tools)
         base_tools = [current_time, get_weather, get_alerts]
@@ -785,10 +790,10 @@ class ToolManager:
                 logger.info(
                     f"Including {len(mcp_tools)} MCP tools for {mode.value} mode"
                 )
-                return base_tools + mcp_tools
+                return base_tools + [get_weather_and_alerts] + mcp_tools
             except ImportError as e:
                 logger.warning(f"Could not import MCP tools: {e}")
-                return base_tools
+                return base_tools + [get_weather_and_alerts]
 
     def validate_tool(self, tool_def: ToolDefinition) -> ToolValidationResult:
         """Validate a tool for its assigned protocol.
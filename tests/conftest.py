@@ -2,12 +2,38 @@
 Pytest configuration and shared fixtures.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import responses
 
-from src.strands_location_service_weather.location_weather import LocationWeatherClient
+from src.strands_location_service_weather import location_weather, model_factory
+from src.strands_location_service_weather.location_weather import (
+    _ALERTS_CACHE,
+    _FORECAST_CACHE,
+    _POINTS_CACHE,
+    LocationWeatherClient,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_weather_caches():
+    """Keep cached NWS lookups from leaking between tests."""
+    _POINTS_CACHE.clear()
+    _FORECAST_CACHE.clear()
+    _ALERTS_CACHE.clear()
+    yield
+    _POINTS_CACHE.clear()
+    _FORECAST_CACHE.clear()
+    _ALERTS_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    """Keep shared BedrockModel instances (often mocks) from leaking between tests."""
+    model_factory._get_bedrock_model.cache_clear()
+    yield
+    model_factory._get_bedrock_model.cache_clear()
 
 
 @pytest.fixture
@@ -52,7 +78,37 @@ def weather_client(mock_bedrock_model, mock_mcp_client, mock_agent, mock_mcp_too
 
 
 @pytest.fixture
-def mock_weather_responses():
+def forecast_payload():
+    """NWS forecast response with a single Seattle forecast period."""
+    return {
+        "properties": {
+            "periods": [
+                {
+                    "temperature": 72,
+                    "temperatureUnit": "F",
+                    "windSpeed": "10 mph",
+                    "windDirection": "W",
+                    "shortForecast": "Partly Cloudy",
+                    "detailedForecast": "Partly cloudy with light winds",
+                }
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def mock_span():
+    """Patch location_weather._span to hand out one recording MagicMock span."""
+    span = MagicMock()
+    span.is_recording.return_value = True
+    span_cm = MagicMock()
+    span_cm.__enter__.return_value = span
+    with patch.object(location_weather, "_span", return_value=span_cm):
+        yield span
+
+
+@pytest.fixture
+def mock_weather_responses(forecast_payload):
     """Mock HTTP responses for weather API calls."""
     with responses.RequestsMock() as rsps:
         # Mock NWS points API
@@ -71,20 +127,7 @@ def mock_weather_responses():
         rsps.add(
             responses.GET,
             "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
-            json={
-                "properties": {
-                    "periods": [
-                        {
-                            "temperature": 72,
-                            "temperatureUnit": "F",
-                            "windSpeed": "10 mph",
-                            "windDirection": "W",
-                            "shortForecast": "Partly Cloudy",
-                            "detailedForecast": "Partly cloudy with light winds",
-                        }
-                    ]
-                }
-            },
+            json=forecast_payload,
             status=200,
         )
 
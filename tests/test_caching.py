@@ -0,0 +1,120 @@
+"""Tests for in-process caching utilities."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.strands_location_service_weather.caching import SingleFlight, TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behavior."""
+
+    def test_get_missing_returns_default(self):
+        """Test that missing keys return the default value."""
+        cache = TTLCache(maxsize=2, ttl=60)
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("key", {"value": 1})
+
+        assert cache.get("key") == {"value": 1}
+        assert len(cache) == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL elapses."""
+        cache = TTLCache(maxsize=2, ttl=10)
+
+        with patch(
+            "src.strands_location_service_weather.caching.time.monotonic"
+        ) as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            cache.set("key", "value")
+
+            mock_monotonic.return_value = 109.0
+            assert cache.get("key") == "value"
+
+            mock_monotonic.return_value = 110.0
+            assert cache.get("key") is None
+            assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction when the cache is full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Touch "a" so "b" becomes the least recently used entry
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        """Test clearing all entries."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
+
+    def test_invalid_maxsize(self):
+        """Test that a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
+
+
+class TestSingleFlight:
+    """Test SingleFlight behavior."""
+
+    def test_returns_result(self):
+        """Test that a lone call runs the function and returns its result."""
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda a, b: a + b, 1, 2) == 3
+        assert len(flight) == 0
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that a caller arriving mid-call waits for the running call."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", slow)
+            while len(flight) == 0:
+                time.sleep(0.001)
+            follower = pool.submit(flight.do, "key", slow)
+            time.sleep(0.05)
+            release.set()
+
+            assert leader.result() == "value"
+            assert follower.result() == "value"
+        assert len(calls) == 1
+        assert len(flight) == 0
+
+    def test_exception_propagates_and_is_not_kept(self):
+        """Test that failures are raised and the next call runs again."""
+        flight = SingleFlight()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.do("key", fail)
+        assert flight.do("key", lambda: "ok") == "ok"
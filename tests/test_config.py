@@ -178,6 +178,7 @@ class TestGuardrailConfig:
         assert config.enable_content_filtering is True
         assert config.enable_pii_detection is True
         assert config.enable_toxicity_detection is True
+        assert config.enable_pre_filter is False
 
     def test_custom_values(self):
         """Test GuardrailConfig with custom values."""
@@ -344,3 +345,8 @@ class TestConfigurationValidation:
             config = DeploymentConfig.from_env_and_config(config_data)
             assert config.timeout == 45
             assert isinstance(config.timeout, int)
+
+        # Test float conversion
+        with patch.dict(os.environ, {"OTEL_TRACE_SAMPLE_RATE": "0.25"}):
+            config = AppConfig.load()
+            assert config.opentelemetry.trace_sample_rate == 0.25
@@ -2,8 +2,9 @@
 Test LocationWeatherClient integration and behavior.
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, PropertyMock, patch
 
+from src.strands_location_service_weather.config import DeploymentMode
 from src.strands_location_service_weather.location_weather import LocationWeatherClient
 
 
@@ -47,6 +48,110 @@ class TestLocationWeatherClient:
         mock_agent_instance.assert_called_once_with("What's the weather in Seattle?")
         assert result == "Weather response"
 
+    def test_deployment_info_uses_tools_from_initialization(self, weather_client):
+        """Test that tool counting does not rebuild the agent's tool specs."""
+        weather_client.agent = Mock()
+
+        info = weather_client.get_deployment_info()
+
+        assert info.tools_count == 4
+        weather_client.agent.tool_registry.get_all_tools_config.assert_not_called()
+
+    def test_deployment_info_built_once(self, weather_client):
+        """Test that repeat deployment info calls reuse the first result."""
+        with patch.object(
+            LocationWeatherClient,
+            "_build_deployment_info",
+            autospec=True,
+            side_effect=LocationWeatherClient._build_deployment_info,
+        ) as build:
+            first = weather_client.get_deployment_info()
+            second = weather_client.get_deployment_info()
+
+        assert first is second
+        build.assert_called_once()
+
+    def test_chat_records_model_metrics(self, weather_client, mock_span):
+        """Test that result metrics are added to the model inference span."""
+        result = Mock()
+        result.metrics.accumulated_usage = {"inputTokens": 10, "nested": {}}
+        result.metrics.cycle_durations = [0.5, 0.25]
+        result.metrics.tool_metrics = {"get_weather": Mock()}
+        weather_client.agent = Mock(return_value=result)
+
+        weather_client.chat("What's the weather in Seattle?")
+
+        attrs = mock_span.set_attributes.call_args_list[-1].args[0]
+        assert attrs["metrics.inputTokens"] == 10
+        assert "metrics.nested" not in attrs
+        assert attrs["metrics.total_duration"] == 0.75
+        assert attrs["metrics.cycle_count"] == 2
+        assert attrs["metrics.tools_used"] == "get_weather"
+
+    def test_chat_skips_metrics_when_span_not_recording(
+        self, weather_client, mock_span
+    ):
+        """Test that metrics are not read for a non-recording span."""
+        result = Mock()
+        metrics = PropertyMock()
+        type(result).metrics = metrics
+        weather_client.agent = Mock(return_value=result)
+        mock_span.is_recording.return_value = False
+
+        weather_client.chat("What's the weather in Seattle?")
+
+        metrics.assert_not_called()
+
+    def test_chat_caps_prompt_attribute(self, weather_client, mock_span):
+        """Test that long prompts are truncated on the span but fully measured."""
+        weather_client.agent = Mock(return_value="ok")
+        prompt = "x" * 2000
+
+        weather_client.chat(prompt)
+
+        mock_span.set_attribute.assert_any_call("prompt", "x" * 512)
+        mock_span.set_attribute.assert_any_call("prompt_length", 2000)
+
+    @patch("src.strands_location_service_weather.location_weather.boto3.client")
+    def test_bedrock_agent_client_reused_across_chats(
+        self, mock_boto_client, mock_bedrock_model
+    ):
+        """Test that the Bedrock Agent runtime client is created once."""
+        mock_boto_client.return_value.invoke_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"Sunny"}}]
+        }
+        client = LocationWeatherClient(
+            deployment_mode=DeploymentMode.BEDROCK_AGENT,
+            config_override={"bedrock_agent_id": "test-agent-123"},
+        )
+
+        assert client.chat("Weather in Seattle?") == "Sunny"
+        assert client.chat("Weather in Boston?") == "Sunny"
+
+        mock_boto_client.assert_called_once()
+        assert mock_boto_client.return_value.invoke_agent.call_count == 2
+
+    @patch("src.strands_location_service_weather.location_weather.boto3.client")
+    def test_bedrock_agent_joins_streamed_chunks(
+        self, mock_boto_client, mock_bedrock_model
+    ):
+        """Test that streamed chunks are joined, even mid-character."""
+        encoded = "Sunny, 72°F".encode()
+        split = encoded.index("°".encode()) + 1
+        mock_boto_client.return_value.invoke_agent.return_value = {
+            "completion": [
+                {"chunk": {"bytes": encoded[:split]}},
+                {"trace": {}},
+                {"chunk": {"bytes": encoded[split:]}},
+            ]
+        }
+        client = LocationWeatherClient(
+            deployment_mode=DeploymentMode.BEDROCK_AGENT,
+            config_override={"bedrock_agent_id": "test-agent-123"},
+        )
+
+        assert client.chat("Weather in Seattle?") == "Sunny, 72°F"
+
     def test_chat_method_handles_exceptions(self, weather_client):
         """Test that chat method handles agent exceptions gracefully."""
         # Mock the agent instance to raise an exception
@@ -2,9 +2,17 @@
 Test FastMCP server functionality.
 """
 
+import asyncio
+import time
 from unittest.mock import Mock, patch
 
-from src.strands_location_service_weather.mcp_server import get_client
+import pytest
+
+from src.strands_location_service_weather.mcp_server import (
+    ask_location_weather,
+    batch_ask_location_weather,
+    get_client,
+)
 
 
 class TestMCPServer:
@@ -74,6 +82,234 @@ class TestMCPServerIntegration:
         assert tool.name == "ask_location_weather"
 
 
+class TestAskLocationWeather:
+    """Test the ask_location_weather tool body."""
+
+    @pytest.mark.asyncio
+    async def test_returns_chat_response(self):
+        """Test that the query is answered by the shared client."""
+        mock_client = Mock()
+        mock_client.chat.return_value = "Sunny in Seattle"
+
+        with patch(
+            "src.strands_location_service_weather.mcp_server.get_client",
+            return_value=mock_client,
+        ):
+            result = await ask_location_weather("Weather in Seattle")
+
+        assert result == "Sunny in Seattle"
+        mock_client.chat.assert_called_once_with("Weather in Seattle")
+
+    @pytest.mark.asyncio
+    async def test_slow_query_times_out(self):
+        """Test that a query exceeding the time limit returns the timeout message."""
+        mock_client = Mock()
+        mock_client.chat.side_effect = lambda query: time.sleep(0.5) or "late"
+
+        with (
+            patch(
+                "src.strands_location_service_weather.mcp_server.get_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "src.strands_location_service_weather.mcp_server.QUERY_TIMEOUT_SECONDS",
+                0.05,
+            ),
+        ):
+            result = await ask_location_weather("Route from NYC to LA")
+
+        assert result.startswith("Query timed out")
+
+    @pytest.mark.asyncio
+    async def test_errors_reported_with_query_context(self):
+        """Test that failures reach the MCP error handler with the query."""
+        mock_client = Mock()
+        mock_client.chat.side_effect = RuntimeError("Bedrock error")
+
+        with (
+            patch(
+                "src.strands_location_service_weather.mcp_server.get_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "src.strands_location_service_weather.mcp_server._error_handler"
+            ) as mock_handler,
+        ):
+            result = await ask_location_weather("Weather in Seattle")
+
+        assert result == "Error processing query: Bedrock error"
+        kwargs = mock_handler.handle_error.call_args.kwargs
+        assert isinstance(kwargs["exception"], RuntimeError)
+        assert kwargs["tool_name"] == "ask_location_weather"
+        assert kwargs["context"].metadata == {"query": "Weather in Seattle"}
+
+    @pytest.mark.asyncio
+    async def test_queued_query_skipped_after_timeout(self):
+        """Test that a query still waiting for the client never chats once timed out."""
+        mock_client = Mock()
+        mock_client.chat.side_effect = lambda query: time.sleep(0.2) or query
+
+        with (
+            patch(
+                "src.strands_location_service_weather.mcp_server.get_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "src.strands_location_service_weather.mcp_server.QUERY_TIMEOUT_SECONDS",
+                0.05,
+            ),
+        ):
+            results = await asyncio.gather(
+                ask_location_weather("Weather in Seattle"),
+                ask_location_weather("Weather in Boston"),
+            )
+            # Let the overrunning chat finish and release the client
+            await asyncio.sleep(0.3)
+
+        assert all(result.startswith("Query timed out") for result in results)
+        mock_client.chat.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_do_not_overlap(self):
+        """Test that chats on the shared client never run at the same time."""
+        active = []
+        overlaps = []
+
+        def chat(query):
+            active.append(query)
+            overlaps.append(len(active) > 1)
+            time.sleep(0.02)
+            active.remove(query)
+            return query
+
+        mock_client = Mock()
+        mock_client.chat.side_effect = chat
+
+        with patch(
+            "src.strands_location_service_weather.mcp_server.get_client",
+            return_value=mock_client,
+        ):
+            results = await asyncio.gather(
+                ask_location_weather("Weather in Seattle"),
+                ask_location_weather("Weather in Boston"),
+            )
+
+        assert sorted(results) == ["Weather in Boston", "Weather in Seattle"]
+        assert not any(overlaps)
+
+    @pytest.mark.asyncio
+    async def test_query_attribute_only_on_recording_span(self):
+        """Test that the truncated query is only attached to recorded spans."""
+        mock_client = Mock()
+        mock_client.chat.return_value = "Sunny in Seattle"
+
+        with (
+            patch(
+                "src.strands_location_service_weather.mcp_server.get_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "src.strands_location_service_weather.mcp_server.tracer"
+            ) as mock_tracer,
+        ):
+            span = mock_tracer.start_as_current_span.return_value.__enter__.return_value
+            span.is_recording.return_value = False
+            await ask_location_weather("Weather in Seattle")
+
+            span.set_attribute.assert_not_called()
+
+            span.is_recording.return_value = True
+            await ask_location_weather("x" * 200)
+
+            span.set_attribute.assert_called_once_with("mcp.query", "x" * 100)
+
+
+class TestBatchAskLocationWeather:
+    """Test the batch_ask_location_weather tool body."""
+
+    @pytest.mark.asyncio
+    async def test_answers_in_query_order(self):
+        """Test that each query gets its own response from the shared client."""
+        mock_client = Mock()
+        mock_client.chat.side_effect = lambda query: f"re: {query}"
+
+        with (
+            patch(
+                "src.strands_location_service_weather.mcp_server.get_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "src.strands_location_service_weather.mcp_server._error_handler"
+            ) as mock_handler,
+        ):
+            results = await batch_ask_location_weather(
+                ["Weather in Seattle", "", "Weather in Boston"]
+            )
+
+        assert results == [
+            "re: Weather in Seattle",
+            "Error: Query parameter is required",
+            "re: Weather in Boston",
+        ]
+        kwargs = mock_handler.handle_error.call_args.kwargs
+        assert isinstance(kwargs["exception"], ValueError)
+        assert kwargs["tool_name"] == "batch_ask_location_weather"
+
+    @pytest.mark.asyncio
+    async def test_each_query_gets_its_own_time_limit(self):
+        """Test that queries run in order without sharing one deadline."""
+        mock_client = Mock()
+        mock_client.chat.side_effect = lambda query: time.sleep(0.1) or query
+        queries = ["Weather in Seattle", "Weather in Boston", "Weather in Denver"]
+
+        with (
+            patch(
+                "src.strands_location_service_weather.mcp_server.get_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "src.strands_location_service_weather.mcp_server.QUERY_TIMEOUT_SECONDS",
+                0.25,
+            ),
+        ):
+            results = await batch_ask_location_weather(queries)
+
+        assert results == queries
+        assert [c.args[0] for c in mock_client.chat.call_args_list] == queries
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_per_query(self):
+        """Test that one failing or slow query does not fail the batch."""
+
+        def chat(query):
+            if query == "slow":
+                time.sleep(0.5)
+            if query == "bad":
+                raise RuntimeError("boom")
+            return "ok"
+
+        mock_client = Mock()
+        mock_client.chat.side_effect = chat
+
+        with (
+            patch(
+                "src.strands_location_service_weather.mcp_server.get_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "src.strands_location_service_weather.mcp_server.QUERY_TIMEOUT_SECONDS",
+                0.1,
+            ),
+        ):
+            results = await batch_ask_location_weather(["good", "bad", "slow"])
+
+        assert results[0] == "ok"
+        assert results[1] == "Error processing query: boom"
+        assert results[2].startswith("Query timed out")
+        # Let the overrunning chat release the shared client
+        await asyncio.sleep(0.5)
+
+
 class TestMCPServerPerformance:
     """Test performance-related aspects of MCP server."""
 
@@ -86,6 +322,21 @@ class TestMCPServerPerformance:
         # (or None if mocked in other tests)
         assert _client is not None or _client is None  # Either state is valid in tests
 
+    def test_run_mcp_server_preinitializes_client(self):
+        """Test that the client is created when the server starts, before serving."""
+        from src.strands_location_service_weather import mcp_server
+
+        with (
+            patch.object(mcp_server, "_client", None),
+            patch.object(mcp_server, "LocationWeatherClient") as mock_client,
+            patch.object(mcp_server.mcp, "run") as mock_run,
+        ):
+            mock_run.side_effect = lambda: mock_client.assert_called_once()
+            mcp_server.run_mcp_server()
+
+            mock_run.assert_called_once()
+            assert mcp_server._client is mock_client.return_value
+
     def test_fastmcp_configuration_performance(self):
         """Test that FastMCP is configured for performance."""
         from src.strands_location_service_weather.mcp_server import mcp
@@ -6,6 +6,7 @@ for ensuring the ModelFactory works correctly across deployment modes.
 """
 
 import pytest
+from strands.models import BedrockModel
 
 from src.strands_location_service_weather.config import DeploymentConfig, DeploymentMode
 from src.strands_location_service_weather.model_factory import (
@@ -52,6 +53,45 @@ class TestModelFactoryEssential:
         assert hasattr(model, "_bedrock_agent_id")
         assert model._bedrock_agent_id == "test-agent-123"
 
+    def test_create_model_reuses_model_for_same_config(self):
+        """Test that identical configs share one BedrockModel."""
+        config = DeploymentConfig(
+            mode=DeploymentMode.LOCAL,
+            bedrock_model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+            aws_region="us-east-1",
+        )
+        other_region = DeploymentConfig(
+            mode=DeploymentMode.LOCAL,
+            bedrock_model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+            aws_region="us-west-2",
+        )
+
+        first = ModelFactory.create_model(config)
+
+        assert ModelFactory.create_model(config) is first
+        assert ModelFactory.create_model(other_region) is not first
+
+    def test_bedrock_agent_models_do_not_share_agent_id(self):
+        """Test that agent attributes are set on a copy of the shared model."""
+        first = ModelFactory.create_model(
+            DeploymentConfig(
+                mode=DeploymentMode.BEDROCK_AGENT,
+                bedrock_agent_id="agent-one",
+                aws_region="us-east-1",
+            )
+        )
+        second = ModelFactory.create_model(
+            DeploymentConfig(
+                mode=DeploymentMode.BEDROCK_AGENT,
+                bedrock_agent_id="agent-two",
+                aws_region="us-east-1",
+            )
+        )
+
+        assert first._bedrock_agent_id == "agent-one"
+        assert second._bedrock_agent_id == "agent-two"
+        assert first.client is second.client
+
     def test_bedrock_agent_mode_requires_agent_id(self):
         """Test that BEDROCK_AGENT mode requires agent_id."""
         with pytest.raises(ValueError, match="bedrock_agent_id is required"):
@@ -108,3 +148,53 @@ class TestModelFactoryValidation:
 
         # Should not raise any exception
         ModelFactory.validate_model_config(config)
+
+    @pytest.mark.parametrize("region", ["us east 1", "us.east.1", "--"])
+    def test_validate_rejects_malformed_region(self, region):
+        """Test validation fails for regions with unexpected characters."""
+        config = DeploymentConfig(
+            mode=DeploymentMode.LOCAL,
+            bedrock_model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+            aws_region=region,
+        )
+
+        with pytest.raises(ValueError, match="Invalid AWS region format"):
+            ModelFactory.validate_model_config(config)
+
+    def test_validate_rejects_underscore_in_agent_id(self):
+        """Test validation fails for agent IDs containing underscores."""
+        config = DeploymentConfig(
+            mode=DeploymentMode.BEDROCK_AGENT,
+            bedrock_agent_id="test_agent",
+            aws_region="us-east-1",
+        )
+
+        with pytest.raises(ValueError, match="Invalid Bedrock agent ID format"):
+            ModelFactory.validate_model_config(config)
+
+
+class TestModelFactoryHealthCheck:
+    """Test model health checks."""
+
+    def test_health_check_passes_for_configured_model(self):
+        """Test that a real BedrockModel with a model ID and region is healthy."""
+        model = BedrockModel(
+            model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+            region_name="us-east-1",
+        )
+
+        assert ModelFactory.health_check(model) is True
+
+    def test_health_check_fails_without_model_id(self):
+        """Test that a BedrockModel whose config lacks a model ID is unhealthy."""
+        model = BedrockModel(
+            model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+            region_name="us-east-1",
+        )
+        model.config.pop("model_id")
+
+        assert ModelFactory.health_check(model) is False
+
+    def test_health_check_fails_for_unknown_model(self):
+        """Test that non-Bedrock models are reported unhealthy."""
+        assert ModelFactory.health_check(object()) is False
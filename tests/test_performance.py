@@ -3,6 +3,7 @@ Test performance optimizations and benchmarks.
 """
 
 import time
+from unittest.mock import patch
 
 import pytest
 import responses
@@ -25,6 +26,41 @@ class TestPerformanceOptimizations:
         session2 = _http_session
         assert session1 is session2
 
+    def test_http_session_pool_size(self):
+        """Test that the session pool is sized from configuration."""
+        from src.strands_location_service_weather.config import config
+        from src.strands_location_service_weather.location_weather import _http_session
+
+        adapter = _http_session.get_adapter("https://api.weather.gov/points/0,0")
+        assert adapter._pool_maxsize == config.weather_api.pool_maxsize
+
+    def test_weather_api_connect_timeout(self):
+        """Test that requests use a short connect timeout and the full read timeout."""
+        from src.strands_location_service_weather.config import config
+        from src.strands_location_service_weather.location_weather import (
+            _WEATHER_API_TIMEOUT,
+        )
+
+        connect, read = _WEATHER_API_TIMEOUT
+        assert connect <= read
+        assert connect == min(
+            config.weather_api.connect_timeout, config.weather_api.timeout
+        )
+        assert read == config.weather_api.timeout
+
+    def test_spans_are_noop_when_tracing_disabled(self):
+        """Test that disabled tracing skips the OpenTelemetry span machinery."""
+        from src.strands_location_service_weather import location_weather
+
+        with (
+            patch.object(location_weather, "_TRACING_ENABLED", False),
+            patch.object(location_weather, "tracer") as mock_tracer,
+        ):
+            with location_weather._span("get_weather_api") as span:
+                assert not span.is_recording()
+
+        mock_tracer.start_as_current_span.assert_not_called()
+
     @responses.activate
     def test_weather_api_timeout_configuration(self):
         """Test that weather API calls use optimized timeout."""
@@ -1,12 +1,23 @@
 """
-Test weather tool functions (get_weather, get_alerts).
+Test weather tool functions (get_weather, get_alerts, get_weather_and_alerts).
 """
 
+import contextvars
+from unittest.mock import patch
+
+import pytest
 import responses
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+from urllib3.response import HTTPResponse
 
+from src.strands_location_service_weather import location_weather
+from src.strands_location_service_weather.config import config
 from src.strands_location_service_weather.location_weather import (
+    _HTTP_RETRY,
+    _format_alert_time,
     get_alerts,
     get_weather,
+    get_weather_and_alerts,
 )
 
 
@@ -14,7 +25,7 @@ class TestGetWeather:
     """Test the get_weather tool function."""
 
     @responses.activate
-    def test_get_weather_success(self):
+    def test_get_weather_success(self, forecast_payload):
         """Test successful weather data retrieval."""
         # Mock NWS points API
         responses.add(
@@ -32,20 +43,7 @@ class TestGetWeather:
         responses.add(
             responses.GET,
             "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
-            json={
-                "properties": {
-                    "periods": [
-                        {
-                            "temperature": 72,
-                            "temperatureUnit": "F",
-                            "windSpeed": "10 mph",
-                            "windDirection": "W",
-                            "shortForecast": "Partly Cloudy",
-                            "detailedForecast": "Partly cloudy with light winds",
-                        }
-                    ]
-                }
-            },
+            json=forecast_payload,
             status=200,
         )
 
@@ -70,6 +68,25 @@ class TestGetWeather:
         assert "error" in result
         assert "Failed to get grid data" in result["error"]
 
+    @responses.activate
+    def test_get_weather_sets_span_attributes_once(self, mock_span):
+        """Test that request details are recorded in a single batch."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            status=500,
+        )
+        get_weather(47.6062, -122.3321)
+
+        mock_span.set_attribute.assert_not_called()
+        mock_span.set_attributes.assert_called_once()
+        attrs = mock_span.set_attributes.call_args.args[0]
+        assert attrs["latitude"] == 47.6062
+        assert attrs["grid.status_code"] == 500
+        assert attrs["grid.cache_hit"] is False
+        assert "grid.duration_ms" in attrs
+        assert attrs["error"] == "Failed to get grid data: 500"
+
     def test_get_weather_invalid_coordinates(self):
         """Test handling of invalid coordinates."""
         # Test with obviously invalid coordinates
@@ -107,6 +124,33 @@ class TestGetAlerts:
         assert len(result) == 1
         assert "No active weather alerts" in result[0]["message"]
 
+    @responses.activate
+    def test_get_alerts_sends_alerts_user_agent(self):
+        """Test that alert requests identify themselves with the alerts agent."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {"county": "https://api.weather.gov/zones/county/WAC033"}
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/alerts/active/zone/WAC033",
+            json={"features": []},
+            status=200,
+        )
+
+        get_alerts(47.6062, -122.3321)
+
+        for call in responses.calls:
+            assert (
+                call.request.headers["User-Agent"]
+                == config.weather_api.user_agent_alerts
+            )
+            assert call.request.headers["Accept"] == config.weather_api.accept_header
+
     @responses.activate
     def test_get_alerts_with_active_alerts(self):
         """Test when weather alerts are active."""
@@ -148,3 +192,361 @@ class TestGetAlerts:
         assert len(result) == 1
         assert result[0]["event"] == "High Wind Warning"
         assert result[0]["severity"] == "Severe"
+
+
+class TestGetWeatherAndAlerts:
+    """Test the get_weather_and_alerts tool function."""
+
+    @responses.activate
+    def test_get_weather_and_alerts_success(self, forecast_payload):
+        """Test that one points lookup feeds both the forecast and alerts."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {
+                    "forecast": "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+                    "county": "https://api.weather.gov/zones/county/WAC033",
+                }
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+            json=forecast_payload,
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/alerts/active/zone/WAC033",
+            json={"features": []},
+            status=200,
+        )
+
+        result = get_weather_and_alerts(47.6062, -122.3321)
+
+        assert result["weather"]["temperature"]["value"] == 72
+        assert result["weather"]["shortForecast"] == "Partly Cloudy"
+        assert "No active weather alerts" in result["alerts"][0]["message"]
+        points_calls = [c for c in responses.calls if "/points/" in c.request.url]
+        assert len(points_calls) == 1
+
+    @responses.activate
+    def test_get_weather_and_alerts_partial_failure(self, forecast_payload):
+        """Test that a failed alerts request does not hide the forecast."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {
+                    "forecast": "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+                    "county": "https://api.weather.gov/zones/county/WAC033",
+                }
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+            json=forecast_payload,
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/alerts/active/zone/WAC033",
+            status=503,
+        )
+
+        result = get_weather_and_alerts(47.6062, -122.3321)
+
+        assert result["weather"]["temperature"]["value"] == 72
+        assert result["alerts"][0]["error"] == "Failed to get alerts data"
+
+    @responses.activate
+    def test_get_weather_and_alerts_grid_failure(self):
+        """Test handling of a failed points lookup."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            status=500,
+        )
+
+        result = get_weather_and_alerts(47.6062, -122.3321)
+
+        assert result["error"] == "Failed to get grid data"
+        assert result["status"] == 500
+
+    @responses.activate
+    def test_get_weather_and_alerts_records_both_failures(self, mock_span):
+        """Test that concurrent forecast and alerts failures both reach the span."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {
+                    "forecast": "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+                    "county": "https://api.weather.gov/zones/county/WAC033",
+                }
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+            status=502,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/alerts/active/zone/WAC033",
+            status=503,
+        )
+
+        get_weather_and_alerts(47.6062, -122.3321)
+
+        attrs = mock_span.set_attributes.call_args.args[0]
+        assert "502" in attrs["error"]
+        assert "Failed to get alerts data: 503" in attrs["error"]
+        assert attrs["forecast.status_code"] == 502
+        assert attrs["alerts.status_code"] == 503
+
+    def test_get_weather_and_alerts_workers_inherit_context(self):
+        """Test that the concurrent fetches run in the caller's context."""
+        probe = contextvars.ContextVar("probe")
+        seen = []
+
+        def fetch(*args):
+            seen.append(probe.get(None))
+            return {}
+
+        with (
+            patch.object(
+                location_weather,
+                "_get_points",
+                return_value=(location_weather._GridPoint("forecast", "WAC033"), 200),
+            ),
+            patch.object(location_weather, "_get_forecast", side_effect=fetch),
+            patch.object(location_weather, "_get_zone_alerts", side_effect=fetch),
+        ):
+            token = probe.set("tool-call")
+            try:
+                get_weather_and_alerts(47.6062, -122.3321)
+            finally:
+                probe.reset(token)
+
+        assert seen == ["tool-call", "tool-call"]
+
+
+class TestPointsCache:
+    """Test caching of NWS grid and alert lookups."""
+
+    @responses.activate
+    def test_points_lookup_cached_across_tools(self):
+        """Test that repeat queries reuse the cached grid and zone data."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {
+                    "forecast": "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+                    "county": "https://api.weather.gov/zones/county/WAC033",
+                }
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/alerts/active/zone/WAC033",
+            json={"features": []},
+            status=200,
+        )
+
+        get_alerts(47.6062, -122.3321)
+        # Nearby coordinates round to the same cache key
+        get_alerts(47.60621, -122.33209)
+
+        points_calls = [c for c in responses.calls if "/points/" in c.request.url]
+        assert len(points_calls) == 1
+
+    @responses.activate
+    def test_alerts_cached_per_zone(self):
+        """Test that repeat alert lookups for a zone reuse the formatted result."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {"county": "https://api.weather.gov/zones/county/WAC033"}
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/alerts/active/zone/WAC033",
+            json={"features": [{"properties": {"event": "Flood Watch"}}]},
+            status=200,
+        )
+
+        first = get_alerts(47.6062, -122.3321)
+        first[0]["event"] = "mutated"
+        second = get_alerts(47.6062, -122.3321)
+
+        assert second[0]["event"] == "Flood Watch"
+        alerts_calls = [c for c in responses.calls if "/alerts/" in c.request.url]
+        assert len(alerts_calls) == 1
+
+    @responses.activate
+    def test_forecast_cached_per_grid(self, forecast_payload):
+        """Test that repeat weather lookups reuse the parsed forecast period."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {
+                    "forecast": "https://api.weather.gov/gridpoints/SEW/125,67/forecast"
+                }
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+            json=forecast_payload,
+            status=200,
+        )
+
+        first = get_weather(47.6062, -122.3321)
+        first["temperature"]["value"] = 0
+        second = get_weather(47.6062, -122.3321)
+
+        assert second["temperature"]["value"] == 72
+        forecast_calls = [c for c in responses.calls if "/forecast" in c.request.url]
+        assert len(forecast_calls) == 1
+
+    @responses.activate
+    def test_alerts_failure_not_cached(self):
+        """Test that failed alert requests are retried on the next call."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {"county": "https://api.weather.gov/zones/county/WAC033"}
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/alerts/active/zone/WAC033",
+            status=503,
+        )
+
+        get_alerts(47.6062, -122.3321)
+        get_alerts(47.6062, -122.3321)
+
+        alerts_calls = [c for c in responses.calls if "/alerts/" in c.request.url]
+        assert len(alerts_calls) == 2 * (_HTTP_RETRY.total + 1)
+
+    @responses.activate
+    def test_points_failure_not_cached(self):
+        """Test that failed lookups are retried on the next call."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            status=500,
+        )
+
+        get_weather(47.6062, -122.3321)
+        get_weather(47.6062, -122.3321)
+
+        points_calls = [c for c in responses.calls if "/points/" in c.request.url]
+        assert len(points_calls) == 2 * (_HTTP_RETRY.total + 1)
+
+
+class TestHTTPRetry:
+    """Test retries on the shared NWS session."""
+
+    @responses.activate
+    def test_transient_failure_retried(self, forecast_payload):
+        """Test that a 503 from the NWS API is retried on the same call."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            status=503,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            json={
+                "properties": {
+                    "forecast": "https://api.weather.gov/gridpoints/SEW/125,67/forecast"
+                }
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/gridpoints/SEW/125,67/forecast",
+            json=forecast_payload,
+            status=200,
+        )
+
+        result = get_weather(47.6062, -122.3321)
+
+        assert result["temperature"]["value"] == 72
+        points_calls = [c for c in responses.calls if "/points/" in c.request.url]
+        assert len(points_calls) == 2
+
+    @responses.activate
+    def test_client_error_not_retried(self):
+        """Test that a 404 is returned without retrying."""
+        responses.add(
+            responses.GET,
+            "https://api.weather.gov/points/47.6062,-122.3321",
+            status=404,
+        )
+
+        result = get_weather(47.6062, -122.3321)
+
+        assert result == {"error": "Failed to get grid data", "status": 404}
+        assert len(responses.calls) == 1
+
+    def test_retry_after_header_not_honored(self):
+        """Test that a long Retry-After does not stall the retry backoff."""
+        retry = _HTTP_RETRY.increment(
+            method="GET",
+            url="/points/47.6062,-122.3321",
+            response=HTTPResponse(status=503, headers={"Retry-After": "120"}),
+        )
+
+        with patch("urllib3.util.retry.time.sleep") as mock_sleep:
+            retry.sleep(HTTPResponse(status=503, headers={"Retry-After": "120"}))
+
+        assert all(call.args[0] < 1 for call in mock_sleep.call_args_list)
+
+    def test_read_timeouts_not_retried(self):
+        """Test that a read timeout is not repeated on the same call."""
+        with pytest.raises(MaxRetryError):
+            _HTTP_RETRY.increment(
+                method="GET",
+                url="/points/47.6062,-122.3321",
+                error=ReadTimeoutError(None, "/points/47.6062,-122.3321", "timed out"),
+            )
+
+
+class TestFormatAlertTime:
+    """Test reformatting of alert timestamps."""
+
+    def test_format_alert_time_matches_strftime(self):
+        """Test that sliced output matches the datetime-based format."""
+        assert _format_alert_time("2024-01-01T12:00:00Z") == "2024-01-01 12:00:00 UTC"
+        assert (
+            _format_alert_time("2024-01-01T04:00:00-08:00")
+            == "2024-01-01 04:00:00 UTC-08:00"
+        )
+        assert (
+            _format_alert_time("2024-01-01T04:00:00.250-08:00")
+            == "2024-01-01 04:00:00 UTC-08:00"
+        )
+
+    def test_format_alert_time_keeps_unparseable_value(self):
+        """Test that malformed timestamps are returned unchanged."""
+        assert _format_alert_time("not a date") == "not a date"